@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections import deque
+from pathlib import Path
+from typing import Callable
+import threading
+
+import arcade
+
+
+SOUND_FILES = {
+    "correct": "correct.wav",
+    "wrong": "wrong.wav",
+    "miss": "miss.wav",
+    "click": "click.wav",
+}
+
+# сколько одновременных голосов одного звука (лишние вытесняют самый старый)
+MAX_VOICES = 3
+
+
+class AssetRegistry:
+    """
+    Общие ассеты процесса:
+    - звуки грузятся один раз в фоновом потоке (preload), игры их переиспользуют
+    - текстуры кэшируются по имени
+    - play() держит не больше MAX_VOICES голосов на каждый звук
+    """
+
+    def __init__(self, sounds_dir: str = "assets/sounds", max_voices: int = MAX_VOICES):
+        self.sounds_dir = Path(sounds_dir)
+        self.max_voices = max_voices
+        self.sounds: dict[str, arcade.Sound] = {}
+        self._textures: dict[str, arcade.Texture] = {}
+        self._voices: dict[str, deque] = {}
+        self._lock = threading.Lock()
+        self._preload_thread: threading.Thread | None = None
+
+    # ---------- звуки ----------
+
+    def _load_sound(self, key: str, filename: str) -> None:
+        path = self.sounds_dir / filename
+        # Не падаем, если файлов нет. Просто не загрузим звук.
+        if path.exists():
+            sound = arcade.load_sound(str(path))
+            with self._lock:
+                self.sounds[key] = sound
+
+    def preload(self) -> threading.Thread:
+        """Фоновая загрузка всех звуков. Повторный вызов ничего не делает."""
+        if self._preload_thread is None:
+            def run():
+                for key, filename in SOUND_FILES.items():
+                    self._load_sound(key, filename)
+
+            self._preload_thread = threading.Thread(target=run, name="assets-preload", daemon=True)
+            self._preload_thread.start()
+        return self._preload_thread
+
+    def play(self, key: str, volume: float = 0.4) -> None:
+        """Играет звук, если он уже загружен (кадр не ждёт загрузку)."""
+        self.preload()
+        with self._lock:
+            snd = self.sounds.get(key)
+        if snd is None:
+            return
+
+        voices = self._voices.setdefault(key, deque())
+        # None (звук не запустился) считаем доигравшим
+        while voices and (voices[0] is None or not snd.is_playing(voices[0])):
+            voices.popleft()
+        if len(voices) >= self.max_voices:
+            arcade.stop_sound(voices.popleft())
+        player = arcade.play_sound(snd, volume=volume)
+        if player is not None:
+            voices.append(player)
+
+    # ---------- текстуры ----------
+
+    def texture(self, name: str, factory: Callable[[], arcade.Texture]) -> arcade.Texture:
+        tex = self._textures.get(name)
+        if tex is None:
+            tex = self._textures[name] = factory()
+        return tex
+
+
+_registry: AssetRegistry | None = None
+
+
+def assets() -> AssetRegistry:
+    """Реестр ассетов на процесс."""
+    global _registry
+    if _registry is None:
+        _registry = AssetRegistry()
+    return _registry
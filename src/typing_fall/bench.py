@@ -0,0 +1,361 @@
+"""
+Бенчмарки typing_fall без окна, на синтетических данных.
+
+    python -m src.typing_fall.bench --out bench.json
+    python -m src.typing_fall.bench --baseline bench.json      # прогон + сравнение
+    python -m src.typing_fall.bench --only sim,particles --quick
+
+Группы: sim (шаг поля из N слов, партия целиком), particles (всплески
+разного размера), storage (рейтинг на БД из --rows результатов),
+words (выбор слова из словаря на --corpus-size слов).
+Большие БД и словари строятся один раз и лежат в --cache-dir.
+
+Для каждого кейса — время одной операции (медиана и минимум по повторам).
+Сравнение помечает регрессией кейс, чья медиана выросла больше, чем на --threshold.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Iterator
+
+from src.typing_fall.corpus import open_corpus
+from src.typing_fall.effects import ParticlePool
+from src.typing_fall.sampling import WordSampler
+from src.typing_fall.simulation import GameSimulation
+from src.typing_fall.storage import LeaderboardFilter, PageCursor, PendingResult, Storage
+from src.typing_fall.ui_models import Settings, MODE_ENDLESS, MODE_TIMED, MODES
+from src.typing_fall.words import WordProvider
+
+
+GROUPS = ("sim", "particles", "storage", "words")
+REPEAT = 5
+THRESHOLD = 0.15  # +15% к медиане — регрессия
+SEED = 12345
+
+SIM_SIZES = (12, 100, 1000)
+BURST_SIZES = (10, 100, 1000)
+
+
+@dataclass
+class Case:
+    """Кейс: fn вызывается number раз подряд, так repeat раз."""
+    name: str
+    fn: Callable[[], object]
+    number: int
+
+
+@dataclass
+class BenchConfig:
+    cache_dir: Path
+    rows: int = 1_000_000
+    corpus_size: int = 1_000_000
+    repeat: int = REPEAT
+    quick: bool = False
+
+
+# ---------- синтетические данные ----------
+
+def synthetic_words(n: int, seed: int = SEED, alphabet: str = "abcdefghijklmnopqrstuvwxyz") -> Iterator[str]:
+    rng = random.Random(seed)
+    for i in range(n):
+        length = rng.randint(3, 12)
+        # суффикс из номера — все слова разные
+        yield "".join(rng.choice(alphabet) for _ in range(length)) + format(i, "x")
+
+
+def corpus_file(cfg: BenchConfig, lang: str = "en", difficulty: int = 1) -> Path:
+    """{lang}_{difficulty}.txt на corpus_size слов (строится один раз)."""
+    words_dir = cfg.cache_dir / f"words_{cfg.corpus_size}"
+    path = words_dir / f"{lang}_{difficulty}.txt"
+    if not path.exists():
+        words_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".txt.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for w in synthetic_words(cfg.corpus_size):
+                f.write(w + "\n")
+        tmp.replace(path)
+    return path
+
+
+def leaderboard_db(cfg: BenchConfig) -> Path:
+    """БД на rows результатов (~rows/100 игроков). Строится одним INSERT-ом пачками."""
+    path = cfg.cache_dir / f"leaderboard_{cfg.rows}.db"
+    if path.exists():
+        return path
+
+    cfg.cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".db.tmp")
+    tmp.unlink(missing_ok=True)
+
+    rng = random.Random(SEED)
+    players = max(1, cfg.rows // 100)
+    start = datetime(2024, 1, 1)
+
+    def rows() -> Iterator[tuple]:
+        for i in range(cfg.rows):
+            score = int(rng.expovariate(1 / 300))
+            yield (
+                rng.randrange(players) + 1,
+                score,
+                rng.uniform(10, 120),
+                rng.random(),
+                (start + timedelta(seconds=i * 7)).strftime("%Y-%m-%d %H:%M:%S"),
+                rng.choice(("ru", "en")),
+                rng.randint(1, 3),
+                rng.choice(MODES),
+                60,
+            )
+
+    with Storage(str(tmp)) as storage:
+        conn = storage._connect()
+        with conn:
+            conn.executemany(
+                "INSERT INTO players(id, nickname) VALUES (?, ?);",
+                ((i + 1, f"bot{i:06d}") for i in range(players)),
+            )
+            conn.executemany(
+                """
+                INSERT INTO results(
+                    player_id, score, wpm, accuracy, created_at,
+                    language, difficulty, mode, duration_sec
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
+                """,
+                rows(),
+            )
+        conn.execute("ANALYZE;")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+    for suffix in ("-wal", "-shm"):
+        Path(str(tmp) + suffix).unlink(missing_ok=True)
+    tmp.replace(path)
+    return path
+
+
+# ---------- кейсы ----------
+
+def _sim_with_words(n: int) -> GameSimulation:
+    sim = GameSimulation(Settings(language="en", difficulty=1, mode=MODE_ENDLESS), seed=SEED, max_words=n)
+    for _ in range(n):
+        sim._spawn_word()
+    return sim
+
+
+def sim_cases(cfg: BenchConfig) -> Iterator[Case]:
+    for n in SIM_SIZES:
+        sim = _sim_with_words(n)
+        f = sim.field
+
+        def step(sim=sim, f=f, n=n):
+            # слова не долетают до пола: поле всегда из n слов
+            if f.y[0] < 200:
+                f.y[:n] += 500
+                f.prev_y[:n] = f.y[:n]
+            sim.step(sim.tick)
+
+        yield Case(f"sim.step[{n}]", step, 200)
+
+    def game():
+        sim = GameSimulation(Settings(language="en", mode=MODE_TIMED, duration_sec=60), seed=SEED)
+        n = 0
+        while not sim.ended:
+            sim.advance(1 / 60)
+            if n % 50 == 0 and sim.field.count:
+                sim.submit(sim.texts[int(sim.field.ids[0])])
+            n += 1
+        return sim.result
+
+    yield Case("sim.game[60s]", game, 1 if cfg.quick else 3)
+
+
+def particle_cases(cfg: BenchConfig) -> Iterator[Case]:
+    for n in BURST_SIZES:
+        pool = ParticlePool(seed=SEED)
+
+        def burst(pool=pool, n=n):
+            pool.emit(500.0, 350.0, (255, 255, 255), n, 3.0)
+            pool.update(1 / 60)
+
+        yield Case(f"particles.burst[{n}]", burst, 500)
+
+    pool = ParticlePool(seed=SEED)
+    pool.emit(500.0, 350.0, (255, 255, 255), pool.capacity, 3.0)
+    yield Case("particles.update[full]", lambda: pool.update(1 / 60), 2000)
+
+
+def storage_cases(cfg: BenchConfig) -> Iterator[Case]:
+    storage = Storage(str(leaderboard_db(cfg)))
+    conn = storage._connect()
+    mid = conn.execute(
+        """
+        SELECT score, created_at, id FROM results
+        ORDER BY score DESC, created_at DESC, id DESC
+        LIMIT 1 OFFSET ?;
+        """,
+        (cfg.rows // 2,),
+    ).fetchone()
+    cursor = PageCursor(int(mid[0]), str(mid[1]), int(mid[2]))
+    flt = LeaderboardFilter("en", 2, MODE_ENDLESS)
+
+    def top_uncached():
+        storage.top_cache.clear()
+        return storage.top_results(10)
+
+    yield Case("storage.top_results[cold]", top_uncached, 200)
+    yield Case("storage.top_results[cached]", lambda: storage.top_results(10), 5000)
+    yield Case("storage.page[mid]", lambda: storage.leaderboard_page(None, cursor, 10), 500)
+    yield Case("storage.page[filtered]", lambda: storage.leaderboard_page(flt, None, 10), 500)
+    yield Case("storage.rank_of[mid]", lambda: storage.rank_of(cursor.score, cursor.created_at, cursor.id), 200)
+    yield Case("storage.best_per_player", lambda: storage.best_per_player_page(None, 10), 500)
+
+    storage.close()
+
+    # запись — во временную БД, чтобы не раздувать общую
+    with tempfile.TemporaryDirectory(dir=cfg.cache_dir) as tmp_dir:
+        rng = random.Random(SEED)
+        with Storage(str(Path(tmp_dir) / "save.db")) as writer:
+
+            def save():
+                writer.save_results(
+                    [PendingResult(f"bot{rng.randrange(100)}", rng.randrange(1000), 40.0, 0.9, "en", 1)]
+                )
+
+            yield Case("storage.save_result", save, 200)
+
+
+def word_cases(cfg: BenchConfig) -> Iterator[Case]:
+    path = corpus_file(cfg)
+    corpus = open_corpus(path, cfg.cache_dir / "twc")
+    rng = random.Random(SEED)
+    sampler = WordSampler(corpus, rng)
+    on_screen = {corpus[i] for i in range(12)}
+
+    yield Case(f"words.corpus_random[{len(corpus)}]", lambda: corpus.random(rng), 20000)
+    yield Case(f"words.sampler_draw[{len(corpus)}]", lambda: sampler.draw(exclude=on_screen), 20000)
+
+    provider = WordProvider(str(path.parent))
+    provider.words("en", 1)  # загрузка не входит в замер
+    yield Case(f"words.get_word[{len(corpus)}]", lambda: provider.get_word("en", 1), 20000)
+
+
+CASES: dict[str, Callable[[BenchConfig], Iterator[Case]]] = {
+    "sim": sim_cases,
+    "particles": particle_cases,
+    "storage": storage_cases,
+    "words": word_cases,
+}
+
+
+# ---------- прогон и сравнение ----------
+
+def measure(case: Case, repeat: int) -> dict[str, float]:
+    case.fn()  # прогрев
+    per_op: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(case.number):
+            case.fn()
+        per_op.append((time.perf_counter() - started) / case.number)
+    return {
+        "median_us": statistics.median(per_op) * 1e6,
+        "min_us": min(per_op) * 1e6,
+        "number": case.number,
+        "repeat": repeat,
+    }
+
+
+def run(cfg: BenchConfig, groups: tuple[str, ...] = GROUPS, log=print) -> dict:
+    results: dict[str, dict[str, float]] = {}
+    for group in groups:
+        for case in CASES[group](cfg):
+            if cfg.quick:
+                case.number = max(1, case.number // 10)
+            results[case.name] = measure(case, cfg.repeat)
+            log(f"{case.name:<32} {results[case.name]['median_us']:12.2f} us")
+    return {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rows": cfg.rows,
+            "corpus_size": cfg.corpus_size,
+            "quick": cfg.quick,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = THRESHOLD) -> list[str]:
+    """Строки отчёта; регрессии помечены 'REGRESSION'. Кейсы без пары пропускаются."""
+    lines = []
+    base = baseline.get("results", {})
+    for name, cur in current.get("results", {}).items():
+        old = base.get(name)
+        if old is None or old["median_us"] <= 0:
+            continue
+        ratio = cur["median_us"] / old["median_us"]
+        mark = "REGRESSION" if ratio > 1 + threshold else ("faster" if ratio < 1 - threshold else "")
+        lines.append(
+            f"{name:<32} {old['median_us']:12.2f} -> {cur['median_us']:12.2f} us  x{ratio:5.2f}  {mark}".rstrip()
+        )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Бенчмарки typing_fall (headless)")
+    parser.add_argument("--out", type=Path, help="куда записать результаты (JSON)")
+    parser.add_argument("--baseline", type=Path, help="JSON прошлого прогона для сравнения")
+    parser.add_argument("--current", type=Path, help="сравнить этот JSON с --baseline без прогона")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="допустимый рост медианы (доля)")
+    parser.add_argument("--only", default=",".join(GROUPS), help="группы через запятую: " + ",".join(GROUPS))
+    parser.add_argument("--rows", type=int, default=1_000_000, help="результатов в БД рейтинга")
+    parser.add_argument("--corpus-size", type=int, default=1_000_000, help="слов в словаре")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--quick", action="store_true", help="в 10 раз меньше итераций")
+    parser.add_argument("--cache-dir", type=Path, default=Path(".bench_cache"))
+    args = parser.parse_args(argv)
+
+    if args.current is not None:
+        if args.baseline is None:
+            parser.error("--current требует --baseline")
+        current = json.loads(args.current.read_text(encoding="utf-8"))
+    else:
+        groups = tuple(g.strip() for g in args.only.split(",") if g.strip())
+        unknown = [g for g in groups if g not in CASES]
+        if unknown:
+            parser.error(f"неизвестные группы: {', '.join(unknown)}")
+        cfg = BenchConfig(
+            cache_dir=args.cache_dir,
+            rows=args.rows,
+            corpus_size=args.corpus_size,
+            repeat=args.repeat,
+            quick=args.quick,
+        )
+        current = run(cfg, groups)
+        if args.out is not None:
+            args.out.write_text(json.dumps(current, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    if args.baseline is None:
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    lines = compare(current, baseline, args.threshold)
+    print("\n".join(lines))
+    regressions = sum(1 for line in lines if line.endswith("REGRESSION"))
+    if regressions:
+        print(f"регрессий: {regressions}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""
+Подбор пресетов DIFFICULTY ботами: много headless-партий на всех ядрах.
+
+Бот печатает со скоростью wpm (5 символов на слово), ошибается в символе
+с вероятностью error_rate (ошибку не исправляет — слово уходит в опечатку)
+и тратит reaction_sec, чтобы заметить новое слово.
+Партия endless идёт до miss_limit промахов или до max_sec секунд.
+
+    python -m src.typing_fall.bots --seeds 16 --out bots.json
+    python -m src.typing_fall.bots --presets candidate.json   # {"2": {"spawn_sec": 1.0, ...}}
+
+Отчёт по каждому пресету и уровню бота: выживание (медиана и доля дошедших
+до max_sec), кривая выживания, очки в минуту, доля упавших слов и опечаток.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Sequence
+
+from src.typing_fall.simulation import DIFFICULTY, EV_FLOOR, EV_SPAWN, EV_TYPO, GameSimulation
+from src.typing_fall.ui_models import Settings, MODE_ENDLESS
+
+
+MISS_LIMIT = 5
+MAX_SEC = 180.0
+SEEDS = 8
+SKILL_WPM = (20, 35, 50, 70, 90)
+SKILL_ERRORS = (0.01, 0.04)
+REACTION_SEC = 0.35
+CURVE_STEP_SEC = 15
+
+
+@dataclass(frozen=True)
+class BotSkill:
+    wpm: float
+    error_rate: float
+    reaction_sec: float = REACTION_SEC
+
+    @property
+    def name(self) -> str:
+        return f"{self.wpm:g}wpm/{self.error_rate:.0%}"
+
+
+@dataclass(frozen=True)
+class GameTask:
+    difficulty: int
+    preset: dict
+    skill: BotSkill
+    seed: int
+    language: str = "en"
+    words_dir: str | None = None
+    miss_limit: int = MISS_LIMIT
+    max_sec: float = MAX_SEC
+
+
+@dataclass(frozen=True)
+class GameStats:
+    difficulty: int
+    skill: str
+    survived_sec: float
+    survived: bool  # дожил до max_sec
+    score: int
+    spawned: int
+    floor: int
+    typos: int
+
+
+class Bot:
+    """Печатает самое низкое слово, которое уже успел заметить."""
+
+    def __init__(self, skill: BotSkill, rng: random.Random):
+        self.skill = skill
+        self.rng = rng
+        self.char_sec = 60.0 / (skill.wpm * 5.0)
+        self.target = -1
+        self.typed = ""
+        self.next_at = 0.0
+        self.seen_at: dict[int, float] = {}  # id -> когда слово появилось
+
+    def on_spawn(self, word_id: int, now: float) -> None:
+        self.seen_at[word_id] = now
+
+    def _pick(self, sim: GameSimulation, now: float) -> int:
+        f = sim.field
+        best, best_y = -1, float("inf")
+        for word_id, y in zip(f.ids[: f.count].tolist(), f.y[: f.count].tolist()):
+            if y < best_y and now - self.seen_at.get(word_id, now) >= self.skill.reaction_sec:
+                best, best_y = word_id, y
+        return best
+
+    def act(self, sim: GameSimulation, now: float) -> str | None:
+        """Одно действие, если пора. Возвращает тип события от submit (или None)."""
+        if now < self.next_at:
+            return None
+
+        if self.target not in sim.texts:
+            # слово упало, пока его печатали — начинаем заново
+            self.typed = ""
+            self.target = self._pick(sim, now)
+            if self.target < 0:
+                return None
+
+        text = sim.texts[self.target]
+        if len(self.typed) < len(text):
+            ch = text[len(self.typed)]
+            if self.rng.random() < self.skill.error_rate:
+                ch = "#"  # любой неверный символ: слово уже не совпадёт
+            self.typed += ch
+            self.next_at = now + self.char_sec * self.rng.uniform(0.7, 1.3)
+            return None
+
+        ev = sim.submit(self.typed)
+        self.typed = ""
+        self.target = -1
+        self.next_at = now + self.skill.reaction_sec
+        return ev.kind if ev is not None else None
+
+
+_words_cache: dict[tuple, Sequence[str] | None] = {}
+
+
+def _words(task: GameTask) -> Sequence[str] | None:
+    """Словарь на процесс (None — встроенные мини-словари симуляции)."""
+    key = (task.words_dir, task.language, task.difficulty)
+    if key not in _words_cache:
+        words = None
+        if task.words_dir is not None:
+            path = Path(task.words_dir) / f"{task.language}_{task.difficulty}.txt"
+            if path.exists():
+                from src.typing_fall.words import WordProvider
+                words = WordProvider(task.words_dir).words(task.language, task.difficulty)
+        _words_cache[key] = words
+    return _words_cache[key]
+
+
+def run_game(task: GameTask) -> GameStats:
+    settings = Settings(language=task.language, difficulty=task.difficulty, mode=MODE_ENDLESS)
+    sim = GameSimulation(settings, seed=task.seed, words=_words(task), preset=task.preset)
+    bot = Bot(task.skill, random.Random(task.seed ^ 0x5EED))
+
+    spawned = floor = typos = 0
+    while floor < task.miss_limit and sim.elapsed < task.max_sec:
+        for ev in sim.step(sim.tick):
+            if ev.kind == EV_SPAWN:
+                spawned += 1
+                bot.on_spawn(ev.word_id, sim.elapsed)
+            elif ev.kind == EV_FLOOR:
+                floor += 1
+        if bot.act(sim, sim.elapsed) == EV_TYPO:
+            typos += 1
+
+    return GameStats(
+        difficulty=task.difficulty,
+        skill=task.skill.name,
+        survived_sec=sim.elapsed,
+        survived=floor < task.miss_limit,
+        score=sim.score,
+        spawned=spawned,
+        floor=floor,
+        typos=typos,
+    )
+
+
+def skill_grid(
+    wpms: Sequence[float] = SKILL_WPM,
+    errors: Sequence[float] = SKILL_ERRORS,
+    reaction_sec: float = REACTION_SEC,
+) -> list[BotSkill]:
+    return [BotSkill(w, e, reaction_sec) for e in errors for w in wpms]
+
+
+def sweep(
+    presets: dict[int, dict],
+    skills: Sequence[BotSkill],
+    seeds: int = SEEDS,
+    workers: int | None = None,
+    **task_kwargs,
+) -> list[GameStats]:
+    """Все партии сетки пресет × бот × seed на пуле процессов."""
+    tasks = [
+        GameTask(difficulty, preset, skill, seed=difficulty * 1_000_003 + i * 7919 + k, **task_kwargs)
+        for difficulty, preset in sorted(presets.items())
+        for k, skill in enumerate(skills)
+        for i in range(seeds)
+    ]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [run_game(t) for t in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_game, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+
+
+def aggregate(games: Sequence[GameStats], max_sec: float = MAX_SEC, step: int = CURVE_STEP_SEC) -> dict:
+    cells: dict[tuple[int, str], list[GameStats]] = {}
+    for g in games:
+        cells.setdefault((g.difficulty, g.skill), []).append(g)
+
+    checkpoints = list(range(step, int(max_sec) + 1, step))
+    report: dict[str, dict[str, dict]] = {}
+    for (difficulty, skill), cell in cells.items():
+        spawned = sum(g.spawned for g in cell) or 1
+        minutes = sum(g.survived_sec for g in cell) / 60.0 or 1.0
+        report.setdefault(str(difficulty), {})[skill] = {
+            "games": len(cell),
+            "survival_median_sec": statistics.median(g.survived_sec for g in cell),
+            "survived_share": sum(g.survived for g in cell) / len(cell),
+            "survival_curve": {
+                str(t): sum(g.survived_sec >= t for g in cell) / len(cell) for t in checkpoints
+            },
+            "score_per_min": sum(g.score for g in cell) / minutes,
+            "miss_rate": sum(g.floor for g in cell) / spawned,
+            "typo_rate": sum(g.typos for g in cell) / spawned,
+        }
+    return report
+
+
+def format_report(report: dict, presets: dict[int, dict]) -> str:
+    lines = []
+    for difficulty, cells in report.items():
+        p = presets[int(difficulty)]
+        lines.append(
+            f"difficulty {difficulty}: spawn_sec={p['spawn_sec']} fall_speed={p['fall_speed']} "
+            f"score_per_word={p['score_per_word']}"
+        )
+        lines.append(f"  {'bot':<14} {'surv med':>9} {'to end':>7} {'score/min':>10} {'miss':>6} {'typo':>6}")
+        for skill, c in cells.items():
+            lines.append(
+                f"  {skill:<14} {c['survival_median_sec']:8.1f}s {c['survived_share']:7.0%} "
+                f"{c['score_per_min']:10.1f} {c['miss_rate']:6.1%} {c['typo_rate']:6.1%}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Подбор DIFFICULTY ботами (headless, на всех ядрах)")
+    parser.add_argument("--presets", type=Path, help='JSON {"1": {"spawn_sec": ..., ...}}; по умолчанию DIFFICULTY')
+    parser.add_argument("--wpm", default=",".join(f"{w:g}" for w in SKILL_WPM))
+    parser.add_argument("--errors", default=",".join(f"{e:g}" for e in SKILL_ERRORS))
+    parser.add_argument("--reaction", type=float, default=REACTION_SEC)
+    parser.add_argument("--seeds", type=int, default=SEEDS, help="партий на клетку сетки")
+    parser.add_argument("--miss-limit", type=int, default=MISS_LIMIT)
+    parser.add_argument("--max-sec", type=float, default=MAX_SEC)
+    parser.add_argument("--lang", choices=("ru", "en"), default="en")
+    parser.add_argument("--words", default="assets/words", help="каталог словарей ('' — встроенные)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", type=Path, help="куда записать отчёт (JSON)")
+    args = parser.parse_args(argv)
+
+    presets = {d: dict(p) for d, p in DIFFICULTY.items()}
+    if args.presets is not None:
+        for d, p in json.loads(args.presets.read_text(encoding="utf-8")).items():
+            presets[int(d)] = {**DIFFICULTY.get(int(d), DIFFICULTY[1]), **p}
+
+    skills = skill_grid(
+        [float(w) for w in args.wpm.split(",")],
+        [float(e) for e in args.errors.split(",")],
+        args.reaction,
+    )
+
+    started = time.perf_counter()
+    games = sweep(
+        presets,
+        skills,
+        seeds=args.seeds,
+        workers=args.workers,
+        language=args.lang,
+        words_dir=args.words or None,
+        miss_limit=args.miss_limit,
+        max_sec=args.max_sec,
+    )
+    spent = time.perf_counter() - started
+
+    report = aggregate(games, args.max_sec)
+    print(format_report(report, presets))
+    print(f"{len(games)} партий за {spent:.1f} с")
+
+    if args.out is not None:
+        payload = {
+            "presets": presets,
+            "skills": [asdict(s) for s in skills],
+            "seeds": args.seeds,
+            "miss_limit": args.miss_limit,
+            "max_sec": args.max_sec,
+            "report": report,
+        }
+        args.out.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
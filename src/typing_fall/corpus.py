@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from array import array
+from pathlib import Path
+import mmap
+import os
+import random
+import shutil
+import struct
+import tempfile
+from typing import Iterator
+
+
+# Формат скомпилированного словаря (.twc):
+#   заголовок 32 байта: magic, версия, число слов, mtime_ns и размер исходника
+#   offsets: (count + 1) x uint32 — начало каждого слова в blob
+#   blob: слова в UTF-8 подряд
+# Числа в нативном порядке байт: это локальный кэш, а не формат обмена.
+MAGIC = b"TFWC"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("=4sIIxxxxqq")  # 32 байта
+CACHE_DIR_NAME = ".cache"
+
+
+class Corpus:
+    """
+    Словарь, открытый через mmap: len() и [i] за O(1),
+    декодируется только запрошенное слово.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, _, _ = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mm.close()
+            raise ValueError(f"{self.path}: не словарь typing_fall")
+
+        self._count = count
+        start = _HEADER.size
+        end = start + (count + 1) * 4
+        self._offsets = memoryview(self._mm)[start:end].cast("I")
+        self._blob = end
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> str:
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        a = self._blob + self._offsets[i]
+        b = self._blob + self._offsets[i + 1]
+        return self._mm[a:b].decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self[i]
+
+    def random(self, rng: random.Random | None = None) -> str:
+        return (rng or random).choice(self)
+
+    def close(self) -> None:
+        self._offsets.release()
+        self._mm.close()
+
+
+def _source_stamp(src: Path) -> tuple[int, int]:
+    st = src.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _is_fresh(compiled: Path, src: Path) -> bool:
+    try:
+        with open(compiled, "rb") as f:
+            header = f.read(_HEADER.size)
+    except OSError:
+        return False
+    if len(header) < _HEADER.size:
+        return False
+    magic, version, _, mtime_ns, size = _HEADER.unpack(header)
+    return magic == MAGIC and version == FORMAT_VERSION and (mtime_ns, size) == _source_stamp(src)
+
+
+def compile_corpus(src: Path, dst: Path) -> Path:
+    """
+    Компилирует .txt (слово на строку) в .twc. Исходник читается построчно,
+    blob пишется во временный файл, в памяти — только массив offsets.
+    """
+    src, dst = Path(src), Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    mtime_ns, size = _source_stamp(src)
+
+    offsets = array("I", [0])
+    with tempfile.TemporaryFile() as blob:
+        pos = 0
+        with open(src, encoding="utf-8") as f:
+            for line in f:
+                w = line.strip()
+                if not w:
+                    continue
+                data = w.encode("utf-8")
+                blob.write(data)
+                pos += len(data)
+                offsets.append(pos)
+
+        fd, tmp_name = tempfile.mkstemp(dir=dst.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(offsets) - 1, mtime_ns, size))
+                offsets.tofile(out)
+                blob.seek(0)
+                shutil.copyfileobj(blob, out)
+            os.replace(tmp_name, dst)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    return dst
+
+
+def open_corpus(src: Path, cache_dir: Path | None = None) -> Corpus:
+    """Открывает словарь, перекомпилируя кэш, если .txt изменился (mtime/размер)."""
+    src = Path(src)
+    cache_dir = Path(cache_dir) if cache_dir is not None else src.parent / CACHE_DIR_NAME
+    compiled = cache_dir / (src.stem + ".twc")
+    if not _is_fresh(compiled, src):
+        compile_corpus(src, compiled)
+    return Corpus(compiled)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from pathlib import Path
-import random
 import arcade
+import numpy as np
 
+from src.typing_fall.assets import AssetRegistry, assets
 
-@dataclass
+
+GRAVITY = 520.0
+PARTICLE_CAPACITY = 1024
+_TEX_RADIUS = 8  # радиус общей текстуры частицы, дальше — scale
+
+
+@dataclass(slots=True)
 class Particle:
     x: float
     y: float
@@ -17,33 +23,148 @@ class Particle:
     color: tuple[int, int, int]
 
 
+class ParticlePool:
+    """
+    Частицы фиксированной ёмкости (struct-of-arrays + кольцевой буфер).
+    Новые частицы перезаписывают самые старые, память не выделяется,
+    обновление — векторное.
+    """
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, seed: int | None = None):
+        self.capacity = int(capacity)
+        self.x = np.zeros(self.capacity, dtype=np.float32)
+        self.y = np.zeros(self.capacity, dtype=np.float32)
+        self.vx = np.zeros(self.capacity, dtype=np.float32)
+        self.vy = np.zeros(self.capacity, dtype=np.float32)
+        self.life = np.zeros(self.capacity, dtype=np.float32)
+        self.radius = np.zeros(self.capacity, dtype=np.float32)
+        self.color = np.zeros((self.capacity, 3), dtype=np.uint8)
+        self.head = 0
+        self.rng = np.random.default_rng(seed)
+
+    def emit(
+        self,
+        x: float,
+        y: float,
+        color: tuple[int, int, int],
+        n: int,
+        radius: float,
+    ) -> np.ndarray:
+        """Добавляет n частиц. Возвращает занятые слоты."""
+        n = min(int(n), self.capacity)
+        slots = (self.head + np.arange(n)) % self.capacity
+        self.head = int((self.head + n) % self.capacity)
+
+        rng = self.rng
+        self.x[slots] = x
+        self.y[slots] = y
+        self.vx[slots] = rng.uniform(-160, 160, n)
+        self.vy[slots] = rng.uniform(80, 280, n)
+        self.life[slots] = rng.uniform(0.35, 0.7, n)
+        self.radius[slots] = rng.uniform(max(1.5, radius - 1), radius + 2, n)
+        self.color[slots] = color
+        return slots
+
+    def update(self, dt: float) -> None:
+        self.life -= dt
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        self.vy -= GRAVITY * dt  # гравитация
+
+    def alive(self) -> np.ndarray:
+        return self.life > 0
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.life > 0))
+
+
+class _SpriteBuffers:
+    """
+    numpy-представления буферов SpriteList (arcade 2.6: array('f') / array('B')
+    по слоту спрайта): позиции, размер и цвет частиц пишутся одним присваиванием,
+    без обхода спрайтов в Python. Это внутренности arcade 2.6 — версия
+    закреплена в requirements.txt (<2.7).
+
+    Спрайты частиц принадлежат только Effects: после сборки их свойства
+    (position, color, texture...) не трогаются — иначе arcade перезапишет
+    слот из устаревших полей Sprite. Список заполняется один раз и не растёт:
+    при росте arcade пересоздаёт буферы (а пока numpy держит представление,
+    расширить array нельзя — BufferError).
+    """
+
+    _FIELDS = ("_sprite_pos_data", "_sprite_size_data", "_sprite_color_data")
+
+    def __init__(self, sprites: arcade.SpriteList):
+        missing = [name for name in self._FIELDS if not hasattr(sprites, name)]
+        if missing:
+            raise RuntimeError(
+                f"arcade {arcade.version.VERSION}: у SpriteList нет {', '.join(missing)} "
+                "(частицы рассчитаны на arcade 2.6)"
+            )
+        for slot, sprite in enumerate(sprites):
+            if sprites.sprite_slot[sprite] != slot:
+                raise RuntimeError(f"частица {slot} попала в слот {sprites.sprite_slot[sprite]} буфера SpriteList")
+
+        self.sprites = sprites
+        n = len(sprites)  # буферы бывают длиннее (запас arcade на рост)
+        self.pos = np.frombuffer(sprites._sprite_pos_data, dtype=np.float32).reshape(-1, 2)[:n]
+        self.size = np.frombuffer(sprites._sprite_size_data, dtype=np.float32).reshape(-1, 2)[:n]
+        self.color = np.frombuffer(sprites._sprite_color_data, dtype=np.uint8).reshape(-1, 4)[:n]
+
+    def changed(self, pos: bool = False, size: bool = False, color: bool = False) -> None:
+        sprites = self.sprites
+        sprites._sprite_pos_changed |= pos
+        sprites._sprite_size_changed |= size
+        sprites._sprite_color_changed |= color
+
+
 class Effects:
     """
     Эффекты проекта:
-    - звуки (если файлы есть в assets/sounds)
-    - частицы (простой particle system)
-    """
+    - звуки (через общий AssetRegistry, если файлы есть в assets/sounds)
+    - частицы (ParticlePool + один SpriteList на все частицы)
 
-    def __init__(self, sounds_dir: str = "assets/sounds"):
-        self.sounds_dir = Path(sounds_dir)
-        self.sounds: dict[str, arcade.Sound] = {}
-        self.particles: list[Particle] = []
+    Один экземпляр на процесс (shared_effects()): спрайты создаются один раз,
+    а не на каждую партию.
+    """
 
-        # Не падаем, если файлов нет. Просто не загрузим звук.
-        self._load_sound("correct", "correct.wav")
-        self._load_sound("wrong", "wrong.wav")
-        self._load_sound("miss", "miss.wav")
-        self._load_sound("click", "click.wav")
+    def __init__(self, registry: AssetRegistry | None = None, particle_capacity: int = PARTICLE_CAPACITY):
+        # звуки и текстуры — общие на процесс, тут ничего не грузится
+        self.assets = registry or assets()
+        self.pool = ParticlePool(particle_capacity)
 
-    def _load_sound(self, key: str, filename: str) -> None:
-        path = self.sounds_dir / filename
-        if path.exists():
-            self.sounds[key] = arcade.load_sound(str(path))
+        # по спрайту на слот пула: создаются один раз, рисуются одним draw()
+        circle = self.assets.texture(
+            "particle-circle",
+            lambda: arcade.make_circle_texture(_TEX_RADIUS * 2, arcade.color.WHITE, name="particle-circle"),
+        )
+        self._sprites = arcade.SpriteList(lazy=True, capacity=self.pool.capacity)
+        for _ in range(self.pool.capacity):
+            sprite = arcade.Sprite(texture=circle)
+            sprite.visible = False
+            self._sprites.append(sprite)
+        self._buffers = _SpriteBuffers(self._sprites)
+        self._shown = np.zeros(self.pool.capacity, dtype=bool)
 
     def play(self, key: str, volume: float = 0.4) -> None:
-        snd = self.sounds.get(key)
-        if snd:
-            arcade.play_sound(snd, volume=volume)
+        self.assets.play(key, volume=volume)
+
+    @property
+    def particles(self) -> list[Particle]:
+        """Снимок живых частиц (для отладки)."""
+        p = self.pool
+        return [
+            Particle(
+                float(p.x[i]),
+                float(p.y[i]),
+                float(p.vx[i]),
+                float(p.vy[i]),
+                float(p.life[i]),
+                float(p.radius[i]),
+                tuple(int(c) for c in p.color[i]),
+            )
+            for i in np.flatnonzero(p.alive())
+        ]
 
     def burst(
         self,
@@ -54,30 +175,49 @@ class Effects:
         radius: float = 3.0,
     ) -> None:
         """Всплеск частиц (под успешный ввод или промах)."""
-        for _ in range(n):
-            vx = random.uniform(-160, 160)
-            vy = random.uniform(80, 280)
-            life = random.uniform(0.35, 0.7)
-            r = random.uniform(max(1.5, radius - 1), radius + 2)
-            self.particles.append(Particle(x, y, vx, vy, life, r, color))
+        slots = self.pool.emit(x, y, color, n, radius)
+
+        # цвет и размер у частицы не меняются — выставляем один раз
+        # (альфу — видимость — выставляет draw())
+        buf = self._buffers
+        buf.color[slots, :3] = color
+        buf.size[slots] = (self.pool.radius[slots] * 2.0)[:, None]
+        buf.changed(size=True, color=True)
 
     def update(self, dt: float) -> None:
         """Обновление физики частиц."""
-        alive: list[Particle] = []
-        for p in self.particles:
-            p.life -= dt
-            if p.life <= 0:
-                continue
+        self.pool.update(dt)
 
-            p.x += p.vx * dt
-            p.y += p.vy * dt
-            p.vy -= 520 * dt  # гравитация
+    def clear(self) -> None:
+        """Гасит все частицы (новая партия)."""
+        self.pool.life[:] = 0.0
 
-            alive.append(p)
+    def draw(self) -> None:
+        """Отрисовка частиц одним батчем."""
+        p = self.pool
+        alive = p.alive()
+        buf = self._buffers
 
-        self.particles = alive
+        # видимость (альфа) — только если она где-то поменялась
+        if not np.array_equal(alive, self._shown):
+            buf.color[:, 3] = alive * np.uint8(255)
+            buf.changed(color=True)
+            self._shown = alive
 
-    def draw(self) -> None:
-        """Отрисовка частиц."""
-        for p in self.particles:
-            arcade.draw_circle_filled(p.x, p.y, p.radius, p.color)
+        if not alive.any():
+            return
+        buf.pos[:, 0] = p.x
+        buf.pos[:, 1] = p.y
+        buf.changed(pos=True)
+        self._sprites.draw()
+
+
+_effects: Effects | None = None
+
+
+def shared_effects() -> Effects:
+    """Эффекты на процесс (создаются при первой игре)."""
+    global _effects
+    if _effects is None:
+        _effects = Effects()
+    return _effects
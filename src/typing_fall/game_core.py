@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 import random
 import time
 
@@ -16,100 +15,148 @@ from src.typing_fall.constants import (
     GOOD_COLOR,
     BAD_COLOR,
 )
-from src.typing_fall.ui_models import Router, MODE_ENDLESS, MODE_TIMED
+from src.typing_fall.ui_models import Router, MODE_TIMED, MODE_PRACTICE
 from src.typing_fall.effects import Effects
+from src.typing_fall.word_atlas import MAX_CARDS, shared_atlas
+from src.typing_fall.words import shared_provider
+from src.typing_fall.profiler import FrameProfiler, LatencyTracer
+from src.typing_fall.replay import ReplayRecorder
+from src.typing_fall.simulation import (
+    DIFFICULTY,  # noqa: F401  (таблица пресетов живёт в simulation)
+    GameResult,
+    GameSimulation,
+    FLOOR_TOP,
+    EV_SPAWN,
+    EV_HIT,
+    EV_FLOOR,
+    EV_TYPO,
+)
+
 
+# сколько слов словаря максимум пререндерить в атлас на старте
+ATLAS_PREBUILD_MAX = MAX_CARDS
 
-# Настройки сложности (3 уровня = "несколько уровней")
-DIFFICULTY = {
-    1: {"spawn_sec": 1.6, "fall_speed": 140, "score_per_word": 10},
-    2: {"spawn_sec": 1.2, "fall_speed": 190, "score_per_word": 14},
-    3: {"spawn_sec": 0.9, "fall_speed": 240, "score_per_word": 18},
-}
-
-# Мини-словари (потом заменим на words.py / assets/words)
-WORDS_RU = {
-    1: ["кот", "дом", "лес", "мир", "окно", "снег", "лук", "сон", "еда", "ключ"],
-    2: ["машина", "комната", "задание", "учебник", "проверка", "карандаш"],
-    3: ["программирование", "взаимодействие", "производительность", "архитектура"],
-}
-WORDS_EN = {
-    1: ["cat", "home", "tree", "wind", "snow", "milk", "code", "game", "fast", "key"],
-    2: ["computer", "keyboard", "window", "project", "accuracy", "practice"],
-    3: ["responsibility", "performance", "architecture", "configuration"],
-}
-
-
-@dataclass(frozen=True)
-class GameResult:
-    score: int
-    correct: int
-    mistakes: int
-    wpm: float
-    accuracy: float
-    time_played_sec: int
+# как часто перестраивать текст оверлея профайлера (сек)
+PROFILER_REFRESH_SEC = 0.25
 
 
 class WordSprite(arcade.Sprite):
-    """Спрайт слова (sprites требование)."""
+    """Спрайт слова (sprites требование): карточка с надписью из WordAtlas."""
 
-    def __init__(self, word: str, x: float, y: float):
-        super().__init__()
-        self.texture = arcade.make_soft_square_texture(220, arcade.color.WHITE, 255, 255)
-        self.scale = 0.35
+    def __init__(self, word: str, x: float, y: float, texture: arcade.Texture):
+        super().__init__(texture=texture)
         self.center_x = x
         self.center_y = y
         self.word = word
 
-        # для "физики"
-        self.change_y = 0.0
+    def reset(self, word: str, x: float, y: float, texture: arcade.Texture) -> None:
+        """Перенастройка на месте (спрайт из пула)."""
+        self.texture = texture
+        self.center_x = x
+        self.center_y = y
+        self.word = word
+        self.color = arcade.color.WHITE
+        self.visible = True
 
-    def draw_word(self):
-        arcade.draw_text(
-            self.word,
-            self.center_x,
-            self.center_y - 8,
-            arcade.color.BLACK,
-            font_size=18,
-            anchor_x="center",
-        )
+
+class WordSpritePool:
+    """
+    Спрайты слов фиксированной ёмкости: создаются один раз и сразу лежат
+    в SpriteList, на спавне перенастраиваются, на удалении — прячутся.
+    Во время игры спрайты не создаются и не удаляются из списка.
+    """
+
+    def __init__(self, capacity: int, texture: arcade.Texture, atlas: arcade.TextureAtlas | None = None):
+        self.sprites = arcade.SpriteList(lazy=True, capacity=capacity, atlas=atlas)
+        self._free: list[WordSprite] = []
+        for _ in range(capacity):
+            self._grow(texture)
+
+    def _grow(self, texture: arcade.Texture) -> None:
+        sprite = WordSprite("", 0, 0, texture)
+        sprite.visible = False
+        self.sprites.append(sprite)
+        self._free.append(sprite)
+
+    def acquire(self, word: str, x: float, y: float, texture: arcade.Texture) -> WordSprite:
+        if not self._free:
+            self._grow(texture)  # ёмкость = max_words симуляции, сюда не попадаем
+        sprite = self._free.pop()
+        sprite.reset(word, x, y, texture)
+        return sprite
+
+    def release(self, sprite: WordSprite) -> None:
+        sprite.visible = False
+        self._free.append(sprite)
+
+    def retexture(self, texture_of, placeholder: arcade.Texture) -> None:
+        """После очистки атласа: видимым — новые карточки их слов, свободным — заглушка."""
+        for sprite in self.sprites:
+            sprite.texture = texture_of(sprite.word) if sprite.visible else placeholder
 
 
 class GameView(arcade.View):
     """
-    Основная игра:
+    Основная игра (рендер поверх GameSimulation):
     - слова падают сверху
     - ввод снизу
     - collide: слово ударилось об пол = промах
-    - "physics engine": используем PhysicsEngineSimple для остановки на полу
     - camera: лёгкий shake при ошибке/промахе
     - particles: через Effects
+    - F3 — оверлей профайлера фаз кадра, F4 — сохранить замеры в JSON
     """
 
-    def __init__(self, router: Router, effects: Effects):
+    def __init__(self, router: Router, effects: Effects, seed: int | None = None):
         super().__init__()
         self.router = router
         self.effects = effects
-
-        self.words = arcade.SpriteList()
+        self.effects.clear()
+
+        # правила игры живут в симуляции, вьюха только рисует
+        s = router.session.settings
+        self.profiler = FrameProfiler()
+        # задержка ввода: клавиша -> кадр, который её показал
+        self.latency = LatencyTracer(self.profiler)
+        words = shared_provider().words(s.language, int(s.difficulty))
+        # seed всегда явный — по нему партия восстанавливается из реплея
+        if seed is None:
+            seed = random.getrandbits(63)
+        self.sim = GameSimulation(
+            s,
+            seed=seed,
+            clock=time.time,
+            words=words,
+            weakness=router.session.weakness,
+            profiler=self.profiler,
+        )
+        self.recorder = ReplayRecorder(self.sim)
+        # practice: индекс букв строится в фоне, до готовности — обычный сэмплер
+        self._wants_letter_index = s.mode == MODE_PRACTICE
+
+        # слова словаря рендерятся в атлас один раз, на старте игры
+        # (огромные словари — лениво, при первом появлении слова)
+        self.atlas = shared_atlas()
+        if len(words) <= ATLAS_PREBUILD_MAX:
+            self.atlas.build(words)
+
+        # спрайты слов переиспользуются: на экране не больше max_words
+        self.word_pool = WordSpritePool(
+            self.sim.max_words, self.atlas.texture(self.sim.words_pool[0]), atlas=self.atlas.atlas
+        )
+        self._atlas_generation = self.atlas.generation
+        self.words = self.word_pool.sprites
+        self.sprites: dict[int, WordSprite] = {}
         self.floor_list = arcade.SpriteList()
 
-        self.floor = arcade.SpriteSolidColor(SCREEN_WIDTH, 20, arcade.color.BLACK)
+        self.floor = arcade.SpriteSolidColor(SCREEN_WIDTH, int(FLOOR_TOP), arcade.color.BLACK)
         self.floor.center_x = SCREEN_WIDTH / 2
-        self.floor.center_y = 10
+        self.floor.center_y = FLOOR_TOP / 2
         self.floor_list.append(self.floor)
 
-        # Physics engines per-word (простая, но работает и засчитывается как “физ.движок”)
-        self.engines: dict[WordSprite, arcade.PhysicsEngineSimple] = {}
-
         self.input_text = ""
-        self.score = 0
-        self.correct = 0
-        self.mistakes = 0
         self._max_input_len = 24
-
-        self._spawn_timer = 0.0
-        self._start_time = 0.0
+        # слова, совпадающие с набранным префиксом (подсвечены)
+        self._highlighted: set[int] = set()
         self._ended = False
 
         # camera
@@ -126,36 +173,192 @@ class GameView(arcade.View):
             anchor_x="left",
         )
 
+        # HUD
+        self._input_left = SCREEN_WIDTH / 2 - 320
+        self._input_right = SCREEN_WIDTH / 2 + 320
+        self._player_text = arcade.Text(
+            f"Игрок: {router.session.nickname}",
+            16,
+            SCREEN_HEIGHT - 70,
+            ACCENT_COLOR,
+            font_size=16,
+            anchor_x="left",
+        )
+        self._stats_text = arcade.Text(
+            "",
+            16,
+            SCREEN_HEIGHT - 95,
+            SUBTEXT_COLOR,
+            font_size=14,
+            anchor_x="left",
+        )
+        self._input_label = arcade.Text(
+            "",
+            self._input_left + 14,
+            58,
+            TEXT_COLOR,
+            font_size=22,
+            anchor_x="left",
+        )
+        self._help_text = arcade.Text(
+            "ENTER — отправить слово | Q — закончить | F3 — профайлер",
+            SCREEN_WIDTH / 2,
+            12,
+            SUBTEXT_COLOR,
+            font_size=14,
+            anchor_x="center",
+        )
+        # последние показанные значения (dirty tracking)
+        self._hud_stats: tuple | None = None
+
+        # оверлей профайлера (текст обновляется раз в PROFILER_REFRESH_SEC)
+        self._show_profiler = False
+        self._profiler_timer = 0.0
+        self._profiler_text = arcade.Text(
+            "",
+            SCREEN_WIDTH - 16,
+            SCREEN_HEIGHT - 16,
+            TEXT_COLOR,
+            font_size=11,
+            font_name=("Courier New", "DejaVu Sans Mono", "monospace"),
+            anchor_x="right",
+            anchor_y="top",
+            multiline=True,
+            width=460,
+        )
+
     def on_show_view(self):
         arcade.set_background_color(BG_COLOR)
-        self._start_time = time.time()
+        self.sim.start()
 
     # ---------- helpers ----------
 
-    def _played(self) -> int:
-        return int(max(0.0, time.time() - self._start_time))
+    @property
+    def score(self) -> int:
+        return self.sim.score
+
+    @property
+    def correct(self) -> int:
+        return self.sim.correct
+
+    @property
+    def mistakes(self) -> int:
+        return self.sim.mistakes
 
     def _time_left(self) -> int:
-        s = self.router.session.settings
-        if s.mode != MODE_TIMED:
-            return 0
-        return max(0, int(s.duration_sec - self._played()))
+        return self.sim.time_left()
+
+    def _remove_sprite(self, word_id: int):
+        self._highlighted.discard(word_id)
+        w = self.sprites.pop(word_id, None)
+        if w is not None:
+            self.word_pool.release(w)
+
+    def _update_highlight(self):
+        """Подсветка слов, которые ещё совпадают с вводом (по индексу, без перебора)."""
+        now = self.sim.matching(self.input_text)
+        for word_id in self._highlighted - now:
+            sprite = self.sprites.get(word_id)
+            if sprite is not None:
+                sprite.color = arcade.color.WHITE
+        for word_id in now - self._highlighted:
+            sprite = self.sprites.get(word_id)
+            if sprite is not None:
+                sprite.color = ACCENT_COLOR
+        self._highlighted = set(now)
+
+    def _apply_events(self, events):
+        for ev in events:
+            if ev.kind == EV_SPAWN:
+                w = self.word_pool.acquire(ev.text, ev.x, ev.y, self.atlas.texture(ev.text))
+                self.sprites[ev.word_id] = w
+                if ev.word_id in self.sim.matching(self.input_text):
+                    w.color = ACCENT_COLOR
+                    self._highlighted.add(ev.word_id)
+
+            elif ev.kind == EV_HIT:
+                self.effects.play("correct")
+                self.effects.burst(ev.x, ev.y, GOOD_COLOR, n=20)
+                self._remove_sprite(ev.word_id)
+
+            elif ev.kind == EV_FLOOR:
+                # промах
+                self.effects.play("miss")
+                self.effects.burst(ev.x, ev.y, BAD_COLOR, n=18)
+                self._shake()
+                self._remove_sprite(ev.word_id)
+
+            elif ev.kind == EV_TYPO:
+                self.effects.play("wrong")
+                self.effects.burst(SCREEN_WIDTH / 2, 70, BAD_COLOR, n=10)
+                self._shake()
 
-    def _pick_word(self) -> str:
+    def _poll_letter_index(self):
         s = self.router.session.settings
-        d = int(s.difficulty)
-        if s.language == "ru":
-            return random.choice(WORDS_RU.get(d, WORDS_RU[1]))
-        return random.choice(WORDS_EN.get(d, WORDS_EN[1]))
+        index = shared_provider().letter_index_nowait(s.language, int(s.difficulty))
+        if index is not None:
+            self.sim.attach_letter_index(index)
+            self.recorder.letter_index_ready()
+            self._wants_letter_index = False
+
+    def _sync_atlas(self):
+        """Атлас карточек очистился (переполнение) — перевыставляем текстуры спрайтов."""
+        if self._atlas_generation == self.atlas.generation:
+            return
+        placeholder = self.atlas.texture(self.sim.words_pool[0])
+        self.word_pool.retexture(self.atlas.texture, placeholder)
+        self._atlas_generation = self.atlas.generation
+
+    def _sync_sprites(self):
+        # позиция между двумя шагами симуляции — плавно при любом FPS
+        f = self.sim.field
+        n = f.count
+        ys = f.interpolated_y(self.sim.alpha)
+        for word_id, y in zip(f.ids[:n].tolist(), ys.tolist()):
+            sprite = self.sprites.get(word_id)
+            if sprite is not None:
+                sprite.center_y = y
+
+    def _refresh_hud(self):
+        """Обновляет тексты HUD, только если значения поменялись."""
+        s = self.router.session.settings
+        time_left = self._time_left() if s.mode == MODE_TIMED else -1
+        stats = (self.score, self.correct, self.mistakes, time_left)
+        if stats != self._hud_stats:
+            self._hud_stats = stats
+            if s.mode == MODE_PRACTICE:
+                mode_text = "практика"
+            else:
+                mode_text = "∞" if time_left < 0 else f"{time_left}s"
+            self._stats_text.text = (
+                f"Score: {self.score} | OK: {self.correct} | Miss: {self.mistakes} | Mode: {mode_text}"
+            )
 
-    def _spawn_word(self):
-        if len(self.words) >= 12:
+        if self._input_label.text != self.input_text:
+            self._input_label.text = self.input_text
+
+    def _refresh_profiler(self, dt: float):
+        self._profiler_timer -= dt
+        if self._profiler_timer > 0:
             return
-        x = random.randint(90, SCREEN_WIDTH - 90)
-        y = SCREEN_HEIGHT + 40
-        w = WordSprite(self._pick_word(), x, y)
-        self.words.append(w)
-        self.engines[w] = arcade.PhysicsEngineSimple(w, self.floor_list)
+        self._profiler_timer = PROFILER_REFRESH_SEC
+        self._profiler_text.text = "\n".join(["профайлер (F4 — сохранить)", *self.profiler.lines()])
+
+    def _dump_profile(self):
+        s = self.router.session.settings
+        path = self.profiler.dump(
+            extra={
+                "settings": {
+                    "language": s.language,
+                    "difficulty": int(s.difficulty),
+                    "mode": s.mode,
+                },
+                "tick_hz": round(1.0 / self.sim.tick),
+                "input_latency": self.latency.report(),
+            }
+        )
+        self._profiler_timer = PROFILER_REFRESH_SEC
+        self._profiler_text.text = f"замеры сохранены: {path}"
 
     def _shake(self, seconds: float = 0.18):
         self._shake_time = max(self._shake_time, seconds)
@@ -165,27 +368,28 @@ class GameView(arcade.View):
             return
         self._ended = True
 
-        played = max(1, self._played())
-        total = self.correct + self.mistakes
-        accuracy = (self.correct / total) if total > 0 else 0.0
-        wpm = (self.correct / played) * 60.0
-
-        result = GameResult(
-            score=self.score,
-            correct=self.correct,
-            mistakes=self.mistakes,
-            wpm=wpm,
-            accuracy=accuracy,
-            time_played_sec=played,
+        result: GameResult = self.sim.finish()
+        replay = self.recorder.finish(result).encode()
+
+        # Сохраняем результат в БД (в фоне, кадр не ждёт диска)
+        from src.typing_fall.result_writer import result_writer
+        from src.typing_fall.storage import PendingResult
+        saved = result_writer().submit(
+            PendingResult.from_settings(
+                self.router.session.nickname,
+                result.score,
+                result.wpm,
+                result.accuracy,
+                self.router.session.settings,
+                replay=replay,
+            )
         )
 
-        # Сохраняем результат в БД
-        from src.typing_fall.storage import Storage
-        Storage().save_result(self.router.session.nickname, result.score, result.wpm, result.accuracy)
-
-        # Переходим на окно результатов
+        # Переходим на окно результатов сразу
         from src.typing_fall.views_results_leaderboard import ResultsView
-        self.router.go(ResultsView(self.router, score=result.score, wpm=result.wpm, accuracy=result.accuracy))
+        self.router.go(
+            ResultsView(self.router, score=result.score, wpm=result.wpm, accuracy=result.accuracy, saved=saved)
+        )
 
     # ---------- arcade callbacks ----------
 
@@ -193,36 +397,24 @@ class GameView(arcade.View):
         if self._ended:
             return
 
-        self.effects.update(dt)
-
-        s = self.router.session.settings
-        preset = DIFFICULTY.get(int(s.difficulty), DIFFICULTY[1])
-
-        # режим timed
-        if s.mode == MODE_TIMED and self._time_left() <= 0:
+        prof = self.profiler
+        with prof.phase("update"):
+            with prof.phase("particles"):
+                self.effects.update(dt)
+
+            if self._wants_letter_index:
+                self._poll_letter_index()
+            with prof.phase("sim"):
+                events = self.sim.advance(dt)
+            with prof.phase("events"):
+                self._apply_events(events)
+                self._sync_atlas()
+        if self.sim.ended:
             self._finish()
             return
 
-        # спавн
-        self._spawn_timer += dt
-        if self._spawn_timer >= preset["spawn_sec"]:
-            self._spawn_timer = 0.0
-            self._spawn_word()
-
-        # “гравитация” падения + physics engine stop on collide
-        for w in list(self.words):
-            w.change_y = -preset["fall_speed"] * dt * 60  # dt-normalized
-            self.engines[w].update()
-
-            # collide с полом (требование collide)
-            if arcade.check_for_collision(w, self.floor):
-                # промах
-                self.mistakes += 1
-                self.effects.burst(w.center_x, w.center_y, BAD_COLOR, n=18)
-                self._shake()
-
-                w.remove_from_sprite_lists()
-                self.engines.pop(w, None)
+        if self._show_profiler:
+            self._refresh_profiler(dt)
 
         # камера shake
         if self._shake_time > 0:
@@ -234,65 +426,43 @@ class GameView(arcade.View):
             self.camera.move_to((0, 0), speed=0.25)
 
     def on_draw(self):
-        self.clear()
-        self.camera.use()
-
-        # пол
-        self.floor_list.draw()
-
-        # слова (спрайты + текст)
-        self.words.draw()
-        for w in self.words:
-            w.draw_word()
-
-        # частицы
-        self.effects.draw()
-
-        # UI поверх
-        arcade.draw_text(
-            f"Игрок: {self.router.session.nickname}",
-            16,
-            SCREEN_HEIGHT - 70,
-            ACCENT_COLOR,
-            font_size=16,
-            anchor_x="left",
-        )
-
-        s = self.router.session.settings
-        mode_text = "∞" if s.mode == MODE_ENDLESS else f"{self._time_left()}s"
-        arcade.draw_text(
-            f"Score: {self.score} | OK: {self.correct} | Miss: {self.mistakes} | Mode: {mode_text}",
-            16,
-            SCREEN_HEIGHT - 95,
-            SUBTEXT_COLOR,
-            font_size=14,
-            anchor_x="left",
-        )
-
-        # поле ввода снизу
-        left = SCREEN_WIDTH / 2 - 320
-        right = SCREEN_WIDTH / 2 + 320
-        bottom = 38
-        top = 92
-        arcade.draw_lrbt_rectangle_outline(left, right, bottom, top, SUBTEXT_COLOR, border_width=2)
-
-        arcade.draw_text(
-            self.input_text,
-            left + 14,
-            58,
-            TEXT_COLOR,
-            font_size=22,
-            anchor_x="left",
-        )
-
-        arcade.draw_text(
-            "ENTER — отправить слово | Q — закончить",
-            SCREEN_WIDTH / 2,
-            12,
-            SUBTEXT_COLOR,
-            font_size=14,
-            anchor_x="center",
-        )
+        prof = self.profiler
+        with prof.phase("draw"):
+            self.clear()
+            self.camera.use()
+            with prof.phase("sync"):
+                self._sync_sprites()
+
+            # пол
+            self.floor_list.draw()
+
+            # слова: карточка и надпись — одна текстура, один draw
+            with prof.phase("sprites"):
+                self.words.draw()
+
+            # частицы
+            with prof.phase("particles.draw"):
+                self.effects.draw()
+
+            # UI поверх (retained-mode: тексты перестраиваются только при изменениях)
+            with prof.phase("hud"):
+                self._refresh_hud()
+                self._player_text.draw()
+                self._stats_text.draw()
+
+                # поле ввода снизу
+                arcade.draw_lrbt_rectangle_outline(
+                    self._input_left, self._input_right, 38, 92, SUBTEXT_COLOR, border_width=2
+                )
+                self._input_label.draw()
+                self._help_text.draw()
+
+        # оверлей — вне замера draw, чтобы не мерить самого себя
+        if self._show_profiler:
+            self._profiler_text.draw()
+
+        # всё, что было введено до этого кадра, уже на экране
+        self.latency.presented()
 
     def on_text(self, text: str):
         if self._ended:
@@ -301,45 +471,41 @@ class GameView(arcade.View):
             return
         if len(self.input_text) >= self._max_input_len:
             return
+        self.latency.mark("echo")
+        self.recorder.text(text)
         self.input_text += text
+        self._update_highlight()
 
     def on_key_press(self, symbol: int, modifiers: int):
         if self._ended:
             return
 
         if symbol == arcade.key.BACKSPACE:
+            self.latency.mark("erase")
+            self.recorder.backspace()
             self.input_text = self.input_text[:-1]
+            self._update_highlight()
             return
 
         if symbol == arcade.key.Q:
             self._finish()
             return
 
-        if symbol == arcade.key.ENTER:
-            typed = self.input_text.strip()
-            if not typed:
-                return
-
-            # проверяем совпадение с любым активным словом
-            matched = None
-            for w in self.words:
-                if w.word == typed:
-                    matched = w
-                    break
-
-            if matched is not None:
-                s = self.router.session.settings
-                preset = DIFFICULTY.get(int(s.difficulty), DIFFICULTY[1])
-
-                self.correct += 1
-                self.score += int(preset["score_per_word"])
-                self.effects.burst(matched.center_x, matched.center_y, GOOD_COLOR, n=20)
+        if symbol == arcade.key.F3:
+            self._show_profiler = not self._show_profiler
+            self._profiler_timer = 0.0
+            return
 
-                matched.remove_from_sprite_lists()
-                self.engines.pop(matched, None)
-            else:
-                self.mistakes += 1
-                self.effects.burst(SCREEN_WIDTH / 2, 70, BAD_COLOR, n=10)
-                self._shake()
+        if symbol == arcade.key.F4:
+            self._dump_profile()
+            return
 
-            self.input_text = ""
\ No newline at end of file
+        if symbol == arcade.key.ENTER:
+            self.recorder.enter()
+            ev = self.sim.submit(self.input_text)
+            if ev is None:
+                return
+            self.latency.mark("submit")
+            self._apply_events([ev])
+            self.input_text = ""
+            self._update_highlight()
@@ -0,0 +1,247 @@
+"""
+Сборка словарей assets/words/{lang}_{1..3}.txt из большого списка слов.
+
+Вход: по слову на строку, опционально с частотой ("слово 1234" или "слово\\t1234").
+Файл читается построчно генераторами, в памяти — только фильтр дублей
+(Bloom-фильтр фиксированного размера или обычный set).
+
+    python -m src.typing_fall.ingest dump.txt --lang ru --out assets/words
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import math
+import os
+import re
+import sys
+import time
+import unicodedata
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+
+SCRIPTS = {
+    "ru": re.compile(r"^[а-яё]+(?:-[а-яё]+)?$"),
+    "en": re.compile(r"^[a-z]+(?:-[a-z]+)?$"),
+}
+
+# длина слова -> базовая сложность
+SHORT_MAX = 4
+MEDIUM_MAX = 8
+
+
+class BloomFilter:
+    """Bloom-фильтр: память фиксирована заранее, ложные «уже было» ~error_rate."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(1, int(capacity))
+        self.bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self._data = bytearray((self.bits + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.bits
+
+    def add(self, item: str) -> bool:
+        """Добавляет item. True — если его (вероятно) ещё не было."""
+        new = False
+        for pos in self._positions(item):
+            byte, bit = divmod(pos, 8)
+            mask = 1 << bit
+            if not self._data[byte] & mask:
+                self._data[byte] |= mask
+                new = True
+        return new
+
+
+class ExactSet:
+    """Точная дедупликация (память растёт с числом уникальных слов)."""
+
+    def __init__(self):
+        self._seen: set[str] = set()
+
+    def add(self, item: str) -> bool:
+        if item in self._seen:
+            return False
+        self._seen.add(item)
+        return True
+
+
+@dataclass
+class IngestStats:
+    lines: int = 0
+    bytes: int = 0
+    kept: int = 0
+    duplicates: int = 0
+    rejected: int = 0
+    per_bucket: dict[int, int] = field(default_factory=lambda: {1: 0, 2: 0, 3: 0})
+    started: float = field(default_factory=time.perf_counter)
+
+    def report(self) -> str:
+        elapsed = max(1e-9, time.perf_counter() - self.started)
+        return (
+            f"{self.lines} строк за {elapsed:.1f} с "
+            f"({self.lines / elapsed:,.0f} строк/с, {self.bytes / elapsed / 1e6:.1f} МБ/с); "
+            f"взято {self.kept}, дублей {self.duplicates}, отброшено {self.rejected}; "
+            f"по уровням {self.per_bucket}"
+        )
+
+
+def read_lines(path: Path, stats: IngestStats, progress_every: int = 0) -> Iterator[str]:
+    """Строки файла; раз в progress_every строк печатает прогресс в stderr."""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            stats.lines += 1
+            stats.bytes += len(line.encode("utf-8"))
+            if progress_every and stats.lines % progress_every == 0:
+                print(stats.report(), file=sys.stderr)
+            yield line
+
+
+def parse(lines: Iterable[str]) -> Iterator[tuple[str, int | None]]:
+    for line in lines:
+        parts = line.split()
+        if not parts:
+            continue
+        freq = None
+        if len(parts) > 1:
+            try:
+                freq = int(parts[1])
+            except ValueError:
+                freq = None
+        yield parts[0], freq
+
+
+def normalize(items: Iterable[tuple[str, int | None]]) -> Iterator[tuple[str, int | None]]:
+    for word, freq in items:
+        yield unicodedata.normalize("NFC", word).lower(), freq
+
+
+def filter_script(
+    items: Iterable[tuple[str, int | None]],
+    language: str,
+    min_len: int,
+    max_len: int,
+    stats: IngestStats,
+) -> Iterator[tuple[str, int | None]]:
+    pattern = SCRIPTS[language]
+    for word, freq in items:
+        if min_len <= len(word) <= max_len and pattern.match(word):
+            yield word, freq
+        else:
+            stats.rejected += 1
+
+
+def dedupe(items: Iterable[tuple[str, int | None]], seen, stats: IngestStats) -> Iterator[tuple[str, int | None]]:
+    for word, freq in items:
+        if seen.add(word):
+            yield word, freq
+        else:
+            stats.duplicates += 1
+
+
+def difficulty_of(word: str, freq: int | None, common: int, rare: int) -> int:
+    """1..3: по длине, частые слова — на уровень проще, редкие — сложнее."""
+    if len(word) <= SHORT_MAX:
+        level = 1
+    elif len(word) <= MEDIUM_MAX:
+        level = 2
+    else:
+        level = 3
+
+    if freq is not None:
+        if freq >= common:
+            level -= 1
+        elif freq < rare:
+            level += 1
+    return min(3, max(1, level))
+
+
+def ingest(
+    src: Path,
+    language: str,
+    out_dir: Path,
+    *,
+    min_len: int = 2,
+    max_len: int = 24,
+    common: int = 100_000,
+    rare: int = 100,
+    bloom_capacity: int | None = 10_000_000,
+    progress_every: int = 1_000_000,
+) -> IngestStats:
+    stats = IngestStats()
+    seen = BloomFilter(bloom_capacity) if bloom_capacity else ExactSet()
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    targets = {d: out_dir / f"{language}_{d}.txt" for d in (1, 2, 3)}
+    tmp = {d: path.with_suffix(".txt.tmp") for d, path in targets.items()}
+    files = {}
+    done = False
+    try:
+        for d, path in tmp.items():
+            files[d] = open(path, "w", encoding="utf-8")
+        items = dedupe(
+            filter_script(
+                normalize(parse(read_lines(src, stats, progress_every))), language, min_len, max_len, stats
+            ),
+            seen,
+            stats,
+        )
+        for word, freq in items:
+            d = difficulty_of(word, freq, common, rare)
+            files[d].write(word + "\n")
+            stats.kept += 1
+            stats.per_bucket[d] += 1
+        for f in files.values():
+            f.close()
+        for d, path in targets.items():
+            os.replace(tmp[d], path)
+        done = True
+    finally:
+        if not done:
+            # ошибка посреди чтения: недописанные .txt.tmp не оставляем
+            for f in files.values():
+                f.close()
+            for path in tmp.values():
+                path.unlink(missing_ok=True)
+    return stats
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Сборка словарей typing_fall по уровням сложности")
+    parser.add_argument("src", type=Path, help="список слов (слово [частота] на строку)")
+    parser.add_argument("--lang", choices=sorted(SCRIPTS), required=True)
+    parser.add_argument("--out", type=Path, default=Path("assets/words"))
+    parser.add_argument("--min-len", type=int, default=2)
+    parser.add_argument("--max-len", type=int, default=24)
+    parser.add_argument("--common", type=int, default=100_000, help="частота, с которой слово на уровень проще")
+    parser.add_argument("--rare", type=int, default=100, help="частота, ниже которой слово на уровень сложнее")
+    parser.add_argument(
+        "--bloom-capacity",
+        type=int,
+        default=10_000_000,
+        help="ожидаемое число уникальных слов для Bloom-фильтра; 0 — точный set",
+    )
+    args = parser.parse_args(argv)
+
+    stats = ingest(
+        args.src,
+        args.lang,
+        args.out,
+        min_len=args.min_len,
+        max_len=args.max_len,
+        common=args.common,
+        rare=args.rare,
+        bloom_capacity=args.bloom_capacity or None,
+    )
+    print(stats.report())
+
+
+if __name__ == "__main__":
+    main()
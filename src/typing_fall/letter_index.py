@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from array import array
+from typing import Container, Mapping, Sequence
+import random
+
+from src.typing_fall.sampling import AliasTable, EXCLUDE_RETRIES
+
+
+def grams(word: str) -> set[str]:
+    """Буквы и биграммы слова (в нижнем регистре)."""
+    w = word.lower()
+    out = set(w)
+    out.update(w[i : i + 2] for i in range(len(w) - 1))
+    return out
+
+
+class LetterIndex:
+    """
+    Инвертированный индекс словаря: буква/биграмма -> id слов (array).
+    Строится один раз на словарь, дальше выбор слова под слабые места — O(1).
+    """
+
+    def __init__(self, words: Sequence[str]):
+        self.words = words
+        postings: dict[str, array] = {}
+        for word_id, word in enumerate(words):
+            for g in grams(word):
+                lst = postings.get(g)
+                if lst is None:
+                    lst = postings[g] = array("I")
+                lst.append(word_id)
+        self.postings = postings
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def count(self, gram: str) -> int:
+        lst = self.postings.get(gram.lower())
+        return len(lst) if lst is not None else 0
+
+    def sampler(self, weakness: Mapping[str, float], rng: random.Random) -> PracticeSampler | None:
+        """Сэмплер под набор слабых мест; None — если ни одна буква не встречается."""
+        targets = [(g.lower(), float(w)) for g, w in weakness.items() if w > 0 and self.count(g)]
+        if not targets:
+            return None
+        return PracticeSampler(self, targets, rng)
+
+
+class PracticeSampler:
+    """
+    Сначала взвешенно выбирается слабое место (AliasTable по весам),
+    затем случайное слово из его posting-листа — обе операции O(1).
+    """
+
+    def __init__(self, index: LetterIndex, targets: list[tuple[str, float]], rng: random.Random):
+        self.index = index
+        self.rng = rng
+        self._lists = [index.postings[g] for g, _ in targets]
+        self._table = AliasTable([w for _, w in targets], rng)
+
+    def draw(self, exclude: Container[str] = ()) -> str:
+        word = self._draw_once()
+        for _ in range(EXCLUDE_RETRIES):
+            if word not in exclude:
+                break
+            word = self._draw_once()
+        return word
+
+    def _draw_once(self) -> str:
+        lst = self._lists[self._table.draw()]
+        return self.index.words[lst[self.rng.randrange(len(lst))]]
@@ -3,6 +3,7 @@ import arcade
 from src.typing_fall.constants import SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE
 from src.typing_fall.ui_models import Session, Router
 from src.typing_fall.views_start_menu import StartView
+from src.typing_fall.result_writer import shutdown_writer
 
 
 def main() -> None:
@@ -12,7 +13,11 @@ def main() -> None:
     router = Router(window, session)
 
     router.go(StartView(router))
-    arcade.run()
+    try:
+        arcade.run()
+    finally:
+        # дописываем результаты, которые ещё в очереди
+        shutdown_writer()
 
 
 if __name__ == "__main__":
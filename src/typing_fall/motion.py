@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+_EMPTY_IDS = np.empty(0, dtype=np.int64)
+_EMPTY_F = np.empty(0, dtype=np.float64)
+
+
+class FallField:
+    """
+    Пакетное падение слов: координаты и скорости лежат в непрерывных
+    массивах numpy (struct-of-arrays), шаг — одна векторная операция,
+    удар об пол — одно сравнение с порогом.
+
+    Порядок слотов = порядок спавна (удаление сохраняет порядок).
+    prev_y — позиции до последнего шага, для интерполяции при рендере.
+    """
+
+    _FIELDS = ("ids", "x", "y", "prev_y", "vy")
+
+    def __init__(self, capacity: int = 64):
+        capacity = max(1, int(capacity))
+        self.ids = np.empty(capacity, dtype=np.int64)
+        self.x = np.empty(capacity, dtype=np.float64)
+        self.y = np.empty(capacity, dtype=np.float64)
+        self.prev_y = np.empty(capacity, dtype=np.float64)
+        self.vy = np.empty(capacity, dtype=np.float64)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _grow(self) -> None:
+        capacity = len(self.ids) * 2
+        for name in self._FIELDS:
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+
+    def add(self, word_id: int, x: float, y: float, vy: float) -> None:
+        if self.count == len(self.ids):
+            self._grow()
+        i = self.count
+        self.ids[i] = word_id
+        self.x[i] = x
+        self.y[i] = y
+        self.prev_y[i] = y
+        self.vy[i] = vy
+        self.count += 1
+
+    def slot_of(self, word_id: int) -> int:
+        found = np.flatnonzero(self.ids[: self.count] == word_id)
+        return int(found[0]) if len(found) else -1
+
+    def remove(self, word_id: int) -> bool:
+        i = self.slot_of(word_id)
+        if i < 0:
+            return False
+        n = self.count
+        for name in self._FIELDS:
+            arr = getattr(self, name)
+            arr[i : n - 1] = arr[i + 1 : n]
+        self.count = n - 1
+        return True
+
+    def step(self, dt: float, floor_y: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Сдвигает все слова на vy * dt и убирает те, что опустились до floor_y.
+        Возвращает (ids, x, y) упавших слов в порядке спавна.
+        """
+        n = self.count
+        y = self.y[:n]
+        self.prev_y[:n] = y
+        y += self.vy[:n] * dt
+
+        hit = y <= floor_y
+        if not hit.any():
+            return _EMPTY_IDS, _EMPTY_F, _EMPTY_F
+
+        hits = (self.ids[:n][hit], self.x[:n][hit], y[hit])
+        keep = ~hit
+        k = int(np.count_nonzero(keep))
+        for name in self._FIELDS:
+            arr = getattr(self, name)
+            arr[:k] = arr[:n][keep]
+        self.count = k
+        return hits
+
+    def interpolated_y(self, alpha: float) -> np.ndarray:
+        """y между предыдущим и текущим шагом: alpha в [0, 1]."""
+        n = self.count
+        prev = self.prev_y[:n]
+        return prev + (self.y[:n] - prev) * alpha
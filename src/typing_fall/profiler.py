@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from contextlib import nullcontext
+from array import array
+from pathlib import Path
+from time import perf_counter_ns
+from typing import ContextManager
+import json
+import time
+
+import numpy as np
+
+
+HISTORY = 600  # кадров на фазу (~10 с при 60 FPS)
+
+
+class RingBuffer:
+    """Последние capacity замеров (в наносекундах) без выделений памяти."""
+
+    def __init__(self, capacity: int = HISTORY):
+        self.data = np.zeros(capacity, dtype=np.int64)
+        self.capacity = capacity
+        self.head = 0
+        self.count = 0
+        self.total = 0  # сколько всего было замеров
+
+    def push(self, value: int) -> None:
+        self.data[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        self.total += 1
+
+    def values(self) -> np.ndarray:
+        return self.data[: self.count]
+
+    def percentiles(self, qs=(50, 95, 99)) -> list[float]:
+        """Перцентили в миллисекундах."""
+        if self.count == 0:
+            return [0.0 for _ in qs]
+        return [float(v) / 1e6 for v in np.percentile(self.values(), qs)]
+
+
+class _Phase:
+    """Замер одной фазы (класс, а не генератор — дешевле на горячем пути)."""
+
+    __slots__ = ("profiler", "name", "started")
+
+    def __init__(self, profiler: FrameProfiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.started = 0
+
+    def __enter__(self) -> None:
+        self.started = perf_counter_ns()
+
+    def __exit__(self, *exc) -> None:
+        self.profiler.record(self.name, perf_counter_ns() - self.started)
+
+
+_NO_PHASE = nullcontext()
+
+
+class FrameProfiler:
+    """
+    Замеры фаз кадра (update/draw) в кольцевых буферах:
+        with profiler.phase("sim"):
+            ...
+    stats() — p50/p95/p99 по фазам, dump() — в JSON для сравнения сессий.
+    """
+
+    def __init__(self, history: int = HISTORY, enabled: bool = True):
+        self.history = history
+        self.enabled = enabled
+        self.phases: dict[str, RingBuffer] = {}
+
+    def record(self, name: str, ns: int) -> None:
+        buf = self.phases.get(name)
+        if buf is None:
+            buf = self.phases[name] = RingBuffer(self.history)
+        buf.push(ns)
+
+    def phase(self, name: str) -> ContextManager[None]:
+        if not self.enabled:
+            return _NO_PHASE
+        return _Phase(self, name)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        out: dict[str, dict[str, float]] = {}
+        for name, buf in self.phases.items():
+            p50, p95, p99 = buf.percentiles()
+            out[name] = {"p50_ms": p50, "p95_ms": p95, "p99_ms": p99, "samples": buf.total}
+        return out
+
+    def lines(self) -> list[str]:
+        """Строки для оверлея."""
+        return [
+            f"{name:<16} p50 {s['p50_ms']:6.3f}  p95 {s['p95_ms']:6.3f}  p99 {s['p99_ms']:6.3f} ms"
+            for name, s in self.stats().items()
+        ]
+
+    def dump(self, path: str | Path | None = None, extra: dict | None = None) -> Path:
+        if path is None:
+            path = Path(f"profile_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        path = Path(path)
+        payload = {
+            "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "history": self.history,
+            "phases": self.stats(),
+        }
+        if extra:
+            payload.update(extra)
+        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        return path
+
+
+class LatencyTracer:
+    """
+    Задержка ввода: от события клавиатуры до конца on_draw кадра,
+    который первым показал результат (эхо ввода, снятие слова, частицы).
+
+    mark(kind) — в обработчике ввода, presented() — в конце on_draw.
+    Все замеры сессии хранятся целиком (array) и дублируются в профайлер
+    как фазы input.<kind>, чтобы их было видно в оверлее.
+    """
+
+    def __init__(self, profiler: FrameProfiler | None = None):
+        self.profiler = profiler
+        self.frame = 0  # номер кадра, который будет нарисован следующим
+        self._pending: list[tuple[str, int]] = []
+        self.samples: dict[str, array] = {}
+        self.frames: dict[str, array] = {}  # кадр, который показал событие
+
+    def mark(self, kind: str) -> None:
+        self._pending.append((kind, perf_counter_ns()))
+
+    def presented(self) -> None:
+        now = perf_counter_ns()
+        for kind, started in self._pending:
+            ns = now - started
+            if kind not in self.samples:
+                self.samples[kind] = array("q")
+                self.frames[kind] = array("I")
+            self.samples[kind].append(ns)
+            self.frames[kind].append(self.frame)
+            if self.profiler is not None:
+                self.profiler.record(f"input.{kind}", ns)
+        self._pending.clear()
+        self.frame += 1
+
+    def report(self) -> dict[str, dict[str, float]]:
+        out: dict[str, dict[str, float]] = {}
+        for kind, lst in self.samples.items():
+            ms = np.frombuffer(lst, dtype=np.int64) / 1e6
+            p50, p95, p99 = np.percentile(ms, (50, 95, 99))
+            out[kind] = {
+                "count": len(lst),
+                "mean_ms": float(ms.mean()),
+                "p50_ms": float(p50),
+                "p95_ms": float(p95),
+                "p99_ms": float(p99),
+                "max_ms": float(ms.max()),
+            }
+        return out
+
+
+# выключенный профайлер для headless-прогонов: phase() ничего не меряет
+NULL_PROFILER = FrameProfiler(history=1, enabled=False)
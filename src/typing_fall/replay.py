@@ -0,0 +1,310 @@
+"""
+Реплеи партий: seed, настройки и поток клавиш со временем в тиках симуляции.
+Симуляция детерминирована (seed + фиксированный шаг), поэтому партию можно
+пересчитать headless — сверить очки или посмотреть, что упало раньше ENTER.
+
+Формат (числа — varint, строки — varint-длина + utf-8):
+    MAGIC, VERSION
+    seed, language, difficulty, mode, duration_sec, tick_hz, max_words, words_count
+    end_tick, played_sec
+    weakness: count, (gram, n) * count
+    keys: count, (delta_tick << 2 | kind [, codepoint]) * count
+
+kind 3 — не клавиша, а отметка «индекс букв готов» (practice): индекс
+строится в фоне, и с этого тика симуляция начинает подбирать слова по нему.
+
+    python -m src.typing_fall.replay 42 --timeline
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass, field, replace
+from typing import Sequence
+
+from src.typing_fall.letter_index import LetterIndex
+from src.typing_fall.simulation import GameResult, GameSimulation, SimEvent
+from src.typing_fall.ui_models import Settings, MODE_PRACTICE
+
+
+MAGIC = b"TFRP"
+VERSION = 2  # v1: индекс букв (practice) был готов с нулевого тика
+
+KEY_CHAR = 0
+KEY_BACKSPACE = 1
+KEY_ENTER = 2
+MARK_LETTER_INDEX = 3
+
+
+# ---------- varint ----------
+
+def write_varint(out: bytearray, n: int) -> None:
+    if n < 0:
+        raise ValueError("varint: только неотрицательные числа")
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    n = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("реплей обрезан")
+        b = data[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _write_str(out: bytearray, s: str) -> None:
+    raw = s.encode("utf-8")
+    write_varint(out, len(raw))
+    out += raw
+
+
+def _read_str(data: bytes, pos: int) -> tuple[str, int]:
+    n, pos = read_varint(data, pos)
+    return data[pos : pos + n].decode("utf-8"), pos + n
+
+
+# ---------- формат ----------
+
+@dataclass
+class Replay:
+    seed: int
+    settings: Settings
+    tick_hz: int
+    max_words: int
+    words_count: int  # размер словаря: другой словарь — другая партия
+    end_tick: int = 0
+    played_sec: int = 0
+    weakness: dict[str, int] = field(default_factory=dict)  # на момент старта (practice)
+    keys: list[tuple[int, int, str]] = field(default_factory=list)  # (tick, kind, char)
+
+    def encode(self) -> bytes:
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        s = self.settings
+        write_varint(out, self.seed)
+        _write_str(out, s.language)
+        write_varint(out, int(s.difficulty))
+        _write_str(out, s.mode)
+        write_varint(out, int(s.duration_sec))
+        write_varint(out, self.tick_hz)
+        write_varint(out, self.max_words)
+        write_varint(out, self.words_count)
+        write_varint(out, self.end_tick)
+        write_varint(out, self.played_sec)
+
+        write_varint(out, len(self.weakness))
+        for gram, n in self.weakness.items():
+            _write_str(out, gram)
+            write_varint(out, int(n))
+
+        write_varint(out, len(self.keys))
+        last = 0
+        for tick, kind, ch in self.keys:
+            write_varint(out, ((tick - last) << 2) | kind)
+            if kind == KEY_CHAR:
+                write_varint(out, ord(ch))
+            last = tick
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, data: bytes) -> Replay:
+        if data[:4] != MAGIC:
+            raise ValueError("не реплей typing_fall")
+        version = data[4]
+        if version not in (1, VERSION):
+            raise ValueError(f"неизвестная версия реплея: {version}")
+        pos = 5
+        seed, pos = read_varint(data, pos)
+        language, pos = _read_str(data, pos)
+        difficulty, pos = read_varint(data, pos)
+        mode, pos = _read_str(data, pos)
+        duration_sec, pos = read_varint(data, pos)
+        tick_hz, pos = read_varint(data, pos)
+        max_words, pos = read_varint(data, pos)
+        words_count, pos = read_varint(data, pos)
+        end_tick, pos = read_varint(data, pos)
+        played_sec, pos = read_varint(data, pos)
+
+        weakness: dict[str, int] = {}
+        count, pos = read_varint(data, pos)
+        for _ in range(count):
+            gram, pos = _read_str(data, pos)
+            weakness[gram], pos = read_varint(data, pos)
+
+        keys: list[tuple[int, int, str]] = []
+        count, pos = read_varint(data, pos)
+        tick = 0
+        for _ in range(count):
+            head, pos = read_varint(data, pos)
+            tick += head >> 2
+            kind = head & 0b11
+            ch = ""
+            if kind == KEY_CHAR:
+                code, pos = read_varint(data, pos)
+                ch = chr(code)
+            keys.append((tick, kind, ch))
+
+        if version == 1 and mode == MODE_PRACTICE:
+            keys.insert(0, (0, MARK_LETTER_INDEX, ""))
+
+        settings = Settings(language=language, difficulty=difficulty, mode=mode, duration_sec=duration_sec)
+        return cls(seed, settings, tick_hz, max_words, words_count, end_tick, played_sec, weakness, keys)
+
+
+class ReplayRecorder:
+    """
+    Пишет реплей по ходу игры. Время клавиши — sim.ticks (завершённые шаги):
+    при проигрывании ввод применяется ровно между теми же шагами.
+    """
+
+    def __init__(self, sim: GameSimulation):
+        if sim.seed is None:
+            raise ValueError("для реплея нужна симуляция с явным seed")
+        self.sim = sim
+        self.replay = Replay(
+            seed=int(sim.seed),
+            settings=replace(sim.settings),
+            tick_hz=round(1.0 / sim.tick),
+            max_words=sim.max_words,
+            words_count=len(sim.words_pool),
+            weakness=dict(sim.weakness),
+        )
+
+    def text(self, text: str) -> None:
+        tick = self.sim.ticks
+        self.replay.keys.extend((tick, KEY_CHAR, ch) for ch in text)
+
+    def backspace(self) -> None:
+        self.replay.keys.append((self.sim.ticks, KEY_BACKSPACE, ""))
+
+    def enter(self) -> None:
+        self.replay.keys.append((self.sim.ticks, KEY_ENTER, ""))
+
+    def letter_index_ready(self) -> None:
+        self.replay.keys.append((self.sim.ticks, MARK_LETTER_INDEX, ""))
+
+    def finish(self, result: GameResult) -> Replay:
+        self.replay.end_tick = self.sim.ticks
+        self.replay.played_sec = int(result.time_played_sec)
+        return self.replay
+
+
+# ---------- проигрывание ----------
+
+@dataclass
+class ReplayRun:
+    result: GameResult
+    # (тик, что произошло, текст): клавиши и события симуляции по порядку
+    timeline: list[tuple[int, str, str]]
+
+
+def play(
+    replay: Replay,
+    words: Sequence[str] | None = None,
+    letter_index: LetterIndex | None = None,
+    timeline: bool = False,
+) -> ReplayRun:
+    """Пересчитывает партию без окна и без ожидания реального времени."""
+    if words is not None and len(words) != replay.words_count:
+        raise ValueError(f"словарь изменился: {len(words)} слов, в реплее {replay.words_count}")
+
+    # часы стоят: партия кончается по end_tick, время игры — из реплея
+    now = [0.0]
+    sim = GameSimulation(
+        replay.settings,
+        seed=replay.seed,
+        clock=lambda: now[0],
+        words=words,
+        max_words=replay.max_words,
+        weakness=dict(replay.weakness),
+        tick_hz=replay.tick_hz,
+    )
+    sim.start()
+    log: list[tuple[int, str, str]] = []
+
+    def run_until(tick: int) -> None:
+        while sim.ticks < tick and not sim.ended:
+            events = sim.step(sim.tick)
+            if timeline:
+                log.extend((sim.ticks, ev.kind, ev.text) for ev in events)
+
+    def note(ev: SimEvent | None) -> None:
+        if timeline and ev is not None:
+            log.append((sim.ticks, ev.kind, ev.text))
+
+    typed = ""
+    for tick, kind, ch in replay.keys:
+        run_until(tick)
+        if kind == KEY_CHAR:
+            typed += ch
+        elif kind == KEY_BACKSPACE:
+            typed = typed[:-1]
+        elif kind == KEY_ENTER:
+            if timeline:
+                log.append((sim.ticks, "enter", typed))
+            ev = sim.submit(typed)
+            note(ev)
+            if ev is not None:
+                typed = ""
+        elif kind == MARK_LETTER_INDEX and letter_index is not None:
+            sim.attach_letter_index(letter_index)
+    run_until(replay.end_tick)
+
+    now[0] = float(replay.played_sec)
+    return ReplayRun(sim.finish(), log)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Проигрывание реплея typing_fall без окна")
+    parser.add_argument("result_id", type=int, help="id результата в БД")
+    parser.add_argument("--db", default="typing_fall.db")
+    parser.add_argument("--words", default="assets/words", help="каталог словарей")
+    parser.add_argument("--timeline", action="store_true", help="вывести клавиши и события по тикам")
+    args = parser.parse_args(argv)
+
+    from src.typing_fall.storage import Storage
+    from src.typing_fall.words import WordProvider
+
+    with Storage(args.db) as storage:
+        row = storage.result(args.result_id)
+        data = storage.replay_of(args.result_id)
+    if row is None or data is None:
+        print(f"нет реплея для результата {args.result_id}", file=sys.stderr)
+        return 2
+
+    replay = Replay.decode(data)
+    s = replay.settings
+    provider = WordProvider(args.words)
+    words = provider.words(s.language, int(s.difficulty))
+    letters = provider.letter_index(s.language, int(s.difficulty)) if s.mode == MODE_PRACTICE else None
+
+    started = time.perf_counter()
+    run = play(replay, words, letters, timeline=args.timeline)
+    spent = time.perf_counter() - started
+
+    if args.timeline:
+        for tick, what, text in run.timeline:
+            print(f"{tick / replay.tick_hz:8.3f}s  {what:<6} {text}")
+
+    r = run.result
+    print(f"реплей: {len(data)} байт, {len(replay.keys)} клавиш, пересчёт {spent * 1000:.1f} мс")
+    print(f"в БД:   score {row.score}, wpm {row.wpm:.1f}, accuracy {row.accuracy:.3f}")
+    print(f"пересчёт: score {r.score}, wpm {r.wpm:.1f}, accuracy {r.accuracy:.3f}")
+    if r.score != row.score:
+        print("очки не совпадают", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from dataclasses import dataclass
+import queue
+import threading
+
+from src.typing_fall.storage import PendingResult, ResultRow, Storage
+
+
+BATCH_MAX = 64
+
+
+@dataclass(frozen=True)
+class SavedResult:
+    """Что кладётся в Future после записи: строка и место в рейтинге (None — не посчиталось)."""
+    row: ResultRow
+    rank: int | None = None
+    total: int | None = None
+
+
+_STOP = object()
+
+
+class ResultWriter:
+    """
+    Асинхронная запись результатов (write-behind):
+    - отдельный поток-писатель со своим Storage
+    - ограниченная очередь, накопившиеся записи пишутся одной транзакцией
+    - flush()/close() — дождаться записи (например, при выходе)
+
+    submit() возвращает Future[SavedResult]: done() — результат в БД.
+    """
+
+    def __init__(self, db_path: str = "typing_fall.db", maxsize: int = 256):
+        self.db_path = db_path
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, name="result-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, result: PendingResult) -> Future:
+        fut: Future = Future()
+        self._queue.put((result, fut))
+        return fut
+
+    def flush(self) -> None:
+        """Ждёт, пока всё, что уже в очереди, будет записано."""
+        self._queue.join()
+
+    def close(self) -> None:
+        if not self._thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _drain(self, first) -> tuple[list, bool]:
+        batch = [first]
+        stop = False
+        while len(batch) < BATCH_MAX:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                stop = True
+                self._queue.task_done()
+                break
+            batch.append(item)
+        return batch, stop
+
+    @staticmethod
+    def _ranked(storage: Storage, row: ResultRow) -> SavedResult:
+        try:
+            rank, total = storage.rank_of(row.score, row.created_at, row.id)
+        except Exception:
+            return SavedResult(row)
+        return SavedResult(row, rank, total)
+
+    def _run(self) -> None:
+        storage = Storage(self.db_path)
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    self._queue.task_done()
+                    return
+
+                batch, stop = self._drain(item)
+                try:
+                    rows = storage.save_results([r for r, _ in batch])
+                except Exception as e:
+                    for _, fut in batch:
+                        fut.set_exception(e)
+                else:
+                    # строки уже в БД: ошибка рейтинга не должна ронять Future
+                    for (_, fut), row in zip(batch, rows):
+                        fut.set_result(self._ranked(storage, row))
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+
+                if stop:
+                    return
+        finally:
+            storage.close()
+
+
+_writer: ResultWriter | None = None
+
+
+def result_writer() -> ResultWriter:
+    """Общий писатель на процесс (создаётся при первом сохранении)."""
+    global _writer
+    if _writer is None:
+        _writer = ResultWriter()
+    return _writer
+
+
+def shutdown_writer() -> None:
+    """Дописать очередь и остановить поток (вызывается при выходе)."""
+    global _writer
+    if _writer is not None:
+        _writer.close()
+        _writer = None
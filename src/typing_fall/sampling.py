@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from array import array
+from typing import Container, Sequence
+import random
+
+
+# сколько раз перетянуть слово, если оно уже на экране
+EXCLUDE_RETRIES = 8
+
+
+class ShuffleBag:
+    """
+    Мешок индексов 0..n-1: каждый выпадает ровно один раз за проход.
+    Ленивый Фишер–Йейтс на dict: O(1) на выдачу, память — O(выданных),
+    от размера словаря не зависит.
+    """
+
+    def __init__(self, n: int, rng: random.Random):
+        self.n = int(n)
+        self.rng = rng
+        self._swaps: dict[int, int] = {}
+        self._pos = 0
+
+    def draw(self) -> int:
+        if self._pos >= self.n:
+            self._swaps.clear()
+            self._pos = 0
+
+        i = self._pos
+        j = self.rng.randrange(i, self.n)
+        swaps = self._swaps
+        picked = swaps.get(j, j)
+        swaps[j] = swaps.pop(i, i)
+        self._pos += 1
+        return picked
+
+
+class AliasTable:
+    """Взвешенный выбор методом Уокера/Воуза: сборка O(n), выдача O(1)."""
+
+    def __init__(self, weights: Sequence[float], rng: random.Random):
+        n = len(weights)
+        if n == 0:
+            raise ValueError("пустые веса")
+        total = float(sum(weights))
+        if total <= 0:
+            weights = [1.0] * n
+            total = float(n)
+
+        self.n = n
+        self.rng = rng
+        self.prob = array("d", [0.0]) * n
+        self.alias = array("I", [0]) * n
+
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = g
+            scaled[g] -= 1.0 - scaled[s]
+            (small if scaled[g] < 1.0 else large).append(g)
+        for i in large + small:
+            self.prob[i] = 1.0
+
+    def draw(self) -> int:
+        i = self.rng.randrange(self.n)
+        return i if self.rng.random() < self.prob[i] else self.alias[i]
+
+
+class WordSampler:
+    """
+    Выбор следующего слова за O(1):
+    - без весов — ShuffleBag (нет коротких повторов)
+    - с весами — AliasTable (например, по частоте слова)
+    - слова, которые сейчас на экране (exclude), перетягиваются
+      фиксированное число раз — цена не растёт с числом активных слов
+    """
+
+    def __init__(
+        self,
+        words: Sequence[str],
+        rng: random.Random | None = None,
+        weights: Sequence[float] | None = None,
+    ):
+        if not len(words):
+            raise ValueError("пустой словарь")
+        self.words = words
+        self.rng = rng or random.Random()
+        if weights is not None:
+            self._source: ShuffleBag | AliasTable = AliasTable(weights, self.rng)
+        else:
+            self._source = ShuffleBag(len(words), self.rng)
+
+    def draw(self, exclude: Container[str] = ()) -> str:
+        word = self.words[self._source.draw()]
+        for _ in range(EXCLUDE_RETRIES):
+            if word not in exclude:
+                break
+            word = self.words[self._source.draw()]
+        return word
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Sequence
+import random
+
+from src.typing_fall.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.typing_fall.ui_models import Settings, MODE_TIMED, MODE_PRACTICE
+from src.typing_fall.motion import FallField
+from src.typing_fall.word_index import WordIndex
+from src.typing_fall.sampling import WordSampler
+from src.typing_fall.letter_index import LetterIndex, PracticeSampler
+from src.typing_fall.profiler import FrameProfiler, NULL_PROFILER
+
+
+# Настройки сложности (3 уровня = "несколько уровней")
+# fall_speed — пикселей в секунду
+DIFFICULTY = {
+    1: {"spawn_sec": 1.6, "fall_speed": 140, "score_per_word": 10},
+    2: {"spawn_sec": 1.2, "fall_speed": 190, "score_per_word": 14},
+    3: {"spawn_sec": 0.9, "fall_speed": 240, "score_per_word": 18},
+}
+
+# Мини-словари для headless-прогонов (в игре слова идут из WordProvider)
+WORDS_RU = {
+    1: ["кот", "дом", "лес", "мир", "окно", "снег", "лук", "сон", "еда", "ключ"],
+    2: ["машина", "комната", "задание", "учебник", "проверка", "карандаш"],
+    3: ["программирование", "взаимодействие", "производительность", "архитектура"],
+}
+WORDS_EN = {
+    1: ["cat", "home", "tree", "wind", "snow", "milk", "code", "game", "fast", "key"],
+    2: ["computer", "keyboard", "window", "project", "accuracy", "practice"],
+    3: ["responsibility", "performance", "architecture", "configuration"],
+}
+
+# Геометрия поля (в координатах экрана)
+MAX_WORDS = 12
+FLOOR_TOP = 20.0            # верх пола
+WORD_HALF_HEIGHT = 38.5     # половина высоты карточки слова
+SPAWN_Y = SCREEN_HEIGHT + 40
+SPAWN_MARGIN_X = 90
+
+# фиксированный шаг симуляции (не зависит от FPS рендера)
+TICK_HZ = 120
+MAX_CATCHUP_STEPS = 8  # больше шагов за кадр не догоняем (лаг -> замедление, а не рывок)
+
+# practice: доля слов, подобранных под слабые места
+PRACTICE_SHARE = 0.7
+
+# Типы событий симуляции
+EV_SPAWN = "spawn"   # появилось новое слово
+EV_HIT = "hit"       # слово введено верно
+EV_FLOOR = "floor"   # слово упало на пол (промах)
+EV_TYPO = "typo"     # введено слово, которого нет на экране
+
+
+@dataclass(frozen=True)
+class GameResult:
+    score: int
+    correct: int
+    mistakes: int
+    wpm: float
+    accuracy: float
+    time_played_sec: int
+
+
+@dataclass(slots=True)
+class SimWord:
+    id: int
+    text: str
+    x: float
+    y: float
+
+
+@dataclass(frozen=True, slots=True)
+class SimEvent:
+    kind: str
+    word_id: int = -1
+    text: str = ""
+    x: float = 0.0
+    y: float = 0.0
+
+
+def default_words(settings: Settings) -> list[str]:
+    d = int(settings.difficulty)
+    if settings.language == "ru":
+        return WORDS_RU.get(d, WORDS_RU[1])
+    return WORDS_EN.get(d, WORDS_EN[1])
+
+
+class GameSimulation:
+    """
+    Правила игры без arcade и без окна:
+    - спавн слов по таймеру
+    - падение и удар об пол = промах
+    - проверка введённого слова и очки
+
+    rng задаётся seed'ом, время — через clock (или суммой dt из step),
+    поэтому партию можно прогнать headless и детерминированно.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        seed: int | None = None,
+        clock: Callable[[], float] | None = None,
+        words: Sequence[str] | None = None,
+        max_words: int = MAX_WORDS,
+        weights: Sequence[float] | None = None,
+        letter_index: LetterIndex | None = None,
+        weakness: dict[str, int] | None = None,
+        tick_hz: float = TICK_HZ,
+        profiler: FrameProfiler | None = None,
+        preset: dict | None = None,
+    ):
+        self.settings = settings
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.clock = clock
+        self.words_pool: Sequence[str] = words if words is not None and len(words) else default_words(settings)
+        # без повторов подряд, с исключением слов на экране
+        self.sampler = WordSampler(self.words_pool, self.rng, weights)
+
+        # practice: индекс букв словаря + счётчик ошибок по буквам/биграммам
+        self.letter_index = letter_index
+        self.weakness: dict[str, int] = weakness if weakness is not None else {}
+        self._practice: PracticeSampler | None = None
+        self._practice_dirty = True
+
+        # preset — свой набор spawn_sec/fall_speed/score_per_word (подбор в bots.py)
+        self.preset = preset or DIFFICULTY.get(int(settings.difficulty), DIFFICULTY[1])
+        # фазы шага (spawn/physics/collision) — замеры на каждый тик
+        self.profiler = profiler or NULL_PROFILER
+
+        # позиции/скорости — пакетно в FallField, тексты — по id
+        self.max_words = int(max_words)
+        self.field = FallField(self.max_words)
+        self.texts: dict[int, str] = {}
+        self.index = WordIndex()
+        self._next_id = 0
+
+        self.score = 0
+        self.correct = 0
+        self.mistakes = 0
+
+        self.elapsed = 0.0
+        self.tick = 1.0 / float(tick_hz)
+        self.ticks = 0  # сколько шагов завершено (время для реплеев)
+        self._accumulator = 0.0
+        self._spawn_timer = 0.0
+        self._start_time = 0.0
+        self.ended = False
+        self.result: GameResult | None = None
+
+    @property
+    def words(self) -> list[SimWord]:
+        """Снимок активных слов в порядке спавна."""
+        f = self.field
+        n = f.count
+        return [
+            SimWord(int(i), self.texts[int(i)], float(x), float(y))
+            for i, x, y in zip(f.ids[:n], f.x[:n], f.y[:n])
+        ]
+
+    def matching(self, prefix: str):
+        """id активных слов, которые начинаются с prefix."""
+        return self.index.matching(prefix.strip())
+
+    # ---------- время ----------
+
+    def start(self) -> None:
+        if self.clock is not None:
+            self._start_time = self.clock()
+
+    def played(self) -> int:
+        if self.clock is not None:
+            return int(max(0.0, self.clock() - self._start_time))
+        return int(self.elapsed)
+
+    def time_left(self) -> int:
+        s = self.settings
+        if s.mode != MODE_TIMED:
+            return 0
+        return max(0, int(s.duration_sec - self.played()))
+
+    # ---------- правила ----------
+
+    def _spawn_word(self) -> SimEvent | None:
+        if self.field.count >= self.max_words:
+            return None
+        x = float(self.rng.randint(SPAWN_MARGIN_X, SCREEN_WIDTH - SPAWN_MARGIN_X))
+        word_id = self._next_id
+        self._next_id += 1
+        text = self._pick_text()
+        self.texts[word_id] = text
+        self.index.add(word_id, text)
+        self.field.add(word_id, x, float(SPAWN_Y), -float(self.preset["fall_speed"]))
+        return SimEvent(EV_SPAWN, word_id, text, x, float(SPAWN_Y))
+
+    def attach_letter_index(self, letter_index: LetterIndex) -> None:
+        """Индекс букв готов (строился в фоне) — practice начинает подбирать слова."""
+        self.letter_index = letter_index
+        self._practice_dirty = True
+
+    def _pick_text(self) -> str:
+        if (
+            self.settings.mode == MODE_PRACTICE
+            and self.letter_index is not None
+            and self.weakness
+            and self.rng.random() < PRACTICE_SHARE
+        ):
+            if self._practice_dirty:
+                self._practice = self.letter_index.sampler(self.weakness, self.rng)
+                self._practice_dirty = False
+            if self._practice is not None:
+                return self._practice.draw(exclude=self.index)
+        return self.sampler.draw(exclude=self.index)
+
+    def _note_weakness(self, typed: str) -> None:
+        """Ищет слово с самым длинным общим префиксом и запоминает букву, где ошиблись."""
+        for k in range(len(typed), 0, -1):
+            ids = self.index.matching(typed[:k])
+            if not ids:
+                continue
+            target = self.texts[min(ids)]
+            if k < len(target):
+                for g in (target[k], target[k - 1 : k + 1]):
+                    self.weakness[g] = self.weakness.get(g, 0) + 1
+                self._practice_dirty = True
+            return
+
+    def step(self, dt: float) -> list[SimEvent]:
+        """Один шаг симуляции. Возвращает события шага (для звуков/частиц)."""
+        events: list[SimEvent] = []
+        if self.ended:
+            return events
+
+        self.elapsed += dt
+
+        # режим timed
+        if self.settings.mode == MODE_TIMED and self.time_left() <= 0:
+            self.finish()
+            return events
+
+        prof = self.profiler
+
+        # спавн (остаток таймера переносится, темп не зависит от шага)
+        with prof.phase("spawn"):
+            self._spawn_timer += dt
+            if self._spawn_timer >= self.preset["spawn_sec"]:
+                self._spawn_timer -= self.preset["spawn_sec"]
+                ev = self._spawn_word()
+                if ev is not None:
+                    events.append(ev)
+
+        # падение + удар об пол (одним векторным шагом)
+        with prof.phase("physics"):
+            ids, xs, ys = self.field.step(dt, FLOOR_TOP + WORD_HALF_HEIGHT)
+
+        with prof.phase("collision"):
+            for word_id, x, y in zip(ids.tolist(), xs.tolist(), ys.tolist()):
+                text = self.texts.pop(word_id)
+                self.index.remove(word_id, text)
+                self.mistakes += 1
+                events.append(SimEvent(EV_FLOOR, word_id, text, x, y))
+
+        self.ticks += 1
+        return events
+
+    def advance(self, frame_dt: float) -> list[SimEvent]:
+        """
+        Прогон за кадр фиксированными шагами tick (аккумулятор).
+        Не больше MAX_CATCHUP_STEPS шагов, остальное отбрасывается.
+        """
+        events: list[SimEvent] = []
+        self._accumulator += frame_dt
+        steps = 0
+        while self._accumulator >= self.tick and not self.ended:
+            if steps >= MAX_CATCHUP_STEPS:
+                self._accumulator = 0.0
+                break
+            events.extend(self.step(self.tick))
+            self._accumulator -= self.tick
+            steps += 1
+        return events
+
+    @property
+    def alpha(self) -> float:
+        """Доля следующего шага, уже прошедшая в реальном времени (для интерполяции)."""
+        return min(1.0, self._accumulator / self.tick)
+
+    def submit(self, typed: str) -> SimEvent | None:
+        """Проверка введённого слова (ENTER). None — если ввод пустой."""
+        if self.ended:
+            return None
+        typed = typed.strip()
+        if not typed:
+            return None
+
+        word_id = self.index.find(typed)
+        if word_id >= 0:
+            f = self.field
+            i = f.slot_of(word_id)
+            x, y = float(f.x[i]), float(f.y[i])
+            f.remove(word_id)
+            self.index.remove(word_id, typed)
+            del self.texts[word_id]
+            self.correct += 1
+            self.score += int(self.preset["score_per_word"])
+            return SimEvent(EV_HIT, word_id, typed, x, y)
+
+        self.mistakes += 1
+        self._note_weakness(typed)
+        return SimEvent(EV_TYPO, text=typed)
+
+    def finish(self) -> GameResult:
+        if self.result is not None:
+            return self.result
+        self.ended = True
+
+        played = max(1, self.played())
+        total = self.correct + self.mistakes
+        accuracy = (self.correct / total) if total > 0 else 0.0
+        wpm = (self.correct / played) * 60.0
+
+        self.result = GameResult(
+            score=self.score,
+            correct=self.correct,
+            mistakes=self.mistakes,
+            wpm=wpm,
+            accuracy=accuracy,
+            time_played_sec=played,
+        )
+        return self.result
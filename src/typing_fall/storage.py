@@ -1,101 +1,660 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable
 
+from src.typing_fall.ui_models import Settings
 
-@dataclass(frozen=True)
+
+# Миграции схемы: (версия, список DDL). Применяются один раз,
+# текущая версия хранится в PRAGMA user_version.
+MIGRATIONS: list[tuple[int, list[str]]] = [
+    (
+        1,
+        [
+            """
+            CREATE TABLE IF NOT EXISTS players(
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                nickname TEXT NOT NULL UNIQUE
+            );
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS results(
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                player_id INTEGER NOT NULL,
+                score INTEGER NOT NULL,
+                wpm REAL NOT NULL,
+                accuracy REAL NOT NULL,
+                created_at TEXT NOT NULL DEFAULT (datetime('now')),
+                FOREIGN KEY(player_id) REFERENCES players(id)
+            );
+            """,
+        ],
+    ),
+    (
+        2,
+        [
+            # покрывающий индекс под рейтинг: ORDER BY score DESC, created_at DESC
+            """
+            CREATE INDEX IF NOT EXISTS idx_results_rank
+            ON results(score DESC, created_at DESC, player_id, wpm, accuracy);
+            """,
+        ],
+    ),
+    (
+        3,
+        [
+            # настройки, при которых получен результат
+            "ALTER TABLE results ADD COLUMN language TEXT NOT NULL DEFAULT '';",
+            "ALTER TABLE results ADD COLUMN difficulty INTEGER NOT NULL DEFAULT 0;",
+            "ALTER TABLE results ADD COLUMN mode TEXT NOT NULL DEFAULT '';",
+            "ALTER TABLE results ADD COLUMN duration_sec INTEGER NOT NULL DEFAULT 0;",
+            # порядок рейтинга = обратный обход (score, created_at, rowid):
+            # id как tie-breaker для keyset-пагинации получается без сортировки
+            "DROP INDEX IF EXISTS idx_results_rank;",
+            "CREATE INDEX IF NOT EXISTS idx_results_order ON results(score, created_at);",
+            """
+            CREATE INDEX IF NOT EXISTS idx_results_settings
+            ON results(language, difficulty, mode, score, created_at);
+            """,
+        ],
+    ),
+    (
+        4,
+        [
+            # гистограмма очков: место игрока = сумма по очкам выше,
+            # цена не зависит от числа результатов
+            """
+            CREATE TABLE IF NOT EXISTS score_histogram(
+                score INTEGER PRIMARY KEY,
+                n INTEGER NOT NULL
+            );
+            """,
+            """
+            INSERT OR REPLACE INTO score_histogram(score, n)
+            SELECT score, COUNT(*) FROM results GROUP BY score;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_results_hist_ins AFTER INSERT ON results
+            BEGIN
+                INSERT INTO score_histogram(score, n) VALUES (NEW.score, 1)
+                ON CONFLICT(score) DO UPDATE SET n = n + 1;
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_results_hist_del AFTER DELETE ON results
+            BEGIN
+                UPDATE score_histogram SET n = n - 1 WHERE score = OLD.score;
+            END;
+            """,
+        ],
+    ),
+    (
+        5,
+        [
+            # сводка по игроку, поддерживается триггерами на results
+            """
+            CREATE TABLE IF NOT EXISTS player_stats(
+                player_id INTEGER PRIMARY KEY REFERENCES players(id),
+                best_score INTEGER NOT NULL,
+                best_wpm REAL NOT NULL,
+                sum_accuracy REAL NOT NULL,
+                games INTEGER NOT NULL,
+                last_played TEXT NOT NULL
+            );
+            """,
+            """
+            INSERT OR REPLACE INTO player_stats(
+                player_id, best_score, best_wpm, sum_accuracy, games, last_played
+            )
+            SELECT player_id, MAX(score), MAX(wpm), SUM(accuracy), COUNT(*), MAX(created_at)
+            FROM results GROUP BY player_id;
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_player_stats_best ON player_stats(best_score, last_played);",
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_results_stats_ins AFTER INSERT ON results
+            BEGIN
+                INSERT INTO player_stats(
+                    player_id, best_score, best_wpm, sum_accuracy, games, last_played
+                )
+                VALUES (NEW.player_id, NEW.score, NEW.wpm, NEW.accuracy, 1, NEW.created_at)
+                ON CONFLICT(player_id) DO UPDATE SET
+                    best_score = MAX(best_score, excluded.best_score),
+                    best_wpm = MAX(best_wpm, excluded.best_wpm),
+                    sum_accuracy = sum_accuracy + excluded.sum_accuracy,
+                    games = games + 1,
+                    last_played = MAX(last_played, excluded.last_played);
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_results_stats_del AFTER DELETE ON results
+            BEGIN
+                DELETE FROM player_stats WHERE player_id = OLD.player_id;
+                INSERT INTO player_stats(
+                    player_id, best_score, best_wpm, sum_accuracy, games, last_played
+                )
+                SELECT player_id, MAX(score), MAX(wpm), SUM(accuracy), COUNT(*), MAX(created_at)
+                FROM results WHERE player_id = OLD.player_id GROUP BY player_id;
+            END;
+            """,
+        ],
+    ),
+    (
+        6,
+        [
+            # реплей партии (см. replay.py), удаляется вместе с результатом
+            """
+            CREATE TABLE IF NOT EXISTS replays(
+                result_id INTEGER PRIMARY KEY REFERENCES results(id) ON DELETE CASCADE,
+                data BLOB NOT NULL
+            );
+            """,
+        ],
+    ),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+@dataclass(frozen=True, slots=True)
 class ResultRow:
     nickname: str
     score: int
     wpm: float
     accuracy: float
     created_at: str
+    language: str = ""
+    difficulty: int = 0
+    mode: str = ""
+    duration_sec: int = 0
+    id: int = 0  # results.id (0 — ещё не записан)
+
+
+@dataclass(frozen=True)
+class PlayerStats:
+    nickname: str
+    best_score: int
+    best_wpm: float
+    avg_accuracy: float
+    games: int
+    last_played: str
+
+
+@dataclass(frozen=True)
+class PendingResult:
+    """Результат, который ещё предстоит записать."""
+    nickname: str
+    score: int
+    wpm: float
+    accuracy: float
+    language: str = ""
+    difficulty: int = 0
+    mode: str = ""
+    duration_sec: int = 0
+    replay: bytes | None = None  # Replay.encode()
+
+    @classmethod
+    def from_settings(
+        cls,
+        nickname: str,
+        score: int,
+        wpm: float,
+        accuracy: float,
+        settings: Settings,
+        replay: bytes | None = None,
+    ) -> PendingResult:
+        return cls(
+            nickname,
+            int(score),
+            float(wpm),
+            float(accuracy),
+            settings.language,
+            int(settings.difficulty),
+            settings.mode,
+            int(settings.duration_sec),
+            replay,
+        )
+
+
+@dataclass(frozen=True)
+class LeaderboardFilter:
+    """
+    Фильтр рейтинга: либо все три поля (язык, сложность, режим), либо ни одного.
+    Частичный фильтр не поддерживается: порядок рейтинга по индексу есть только
+    для полной тройки (idx_results_settings) и для всего рейтинга (idx_results_order),
+    иначе каждая страница сортировала бы все подходящие строки.
+    """
+    language: str | None = None
+    difficulty: int | None = None
+    mode: str | None = None
+
+    def __post_init__(self):
+        given = [v is not None for v in (self.language, self.difficulty, self.mode)]
+        if any(given) and not all(given):
+            raise ValueError("фильтр рейтинга: нужны все поля (language, difficulty, mode) или ни одного")
+
+    @classmethod
+    def for_settings(cls, settings: Settings) -> LeaderboardFilter:
+        return cls(settings.language, int(settings.difficulty), settings.mode)
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Позиция последней строки страницы (keyset-пагинация)."""
+    score: int
+    created_at: str
+    id: int
+
+
+_RESULT_COLUMNS = """
+    r.id, p.nickname, r.score, r.wpm, r.accuracy, r.created_at,
+    r.language, r.difficulty, r.mode, r.duration_sec
+"""
+
+
+_STATS_COLUMNS = """
+    s.player_id, p.nickname, s.best_score, s.best_wpm,
+    s.sum_accuracy / s.games, s.games, s.last_played
+"""
+
+
+def _stats_from_db(row) -> tuple[int, PlayerStats]:
+    player_id, nickname, best_score, best_wpm, avg_accuracy, games, last_played = row
+    return int(player_id), PlayerStats(
+        nickname=str(nickname),
+        best_score=int(best_score),
+        best_wpm=float(best_wpm),
+        avg_accuracy=float(avg_accuracy),
+        games=int(games),
+        last_played=str(last_played),
+    )
+
+
+def _row_from_db(row) -> tuple[int, ResultRow]:
+    result_id, nickname, score, wpm, accuracy, created_at, language, difficulty, mode, duration_sec = row
+    return int(result_id), ResultRow(
+        nickname=str(nickname),
+        score=int(score),
+        wpm=float(wpm),
+        accuracy=float(accuracy),
+        created_at=str(created_at),
+        language=str(language),
+        difficulty=int(difficulty),
+        mode=str(mode),
+        duration_sec=int(duration_sec),
+        id=int(result_id),
+    )
+
+
+TOP_CACHE_SIZE = 50
+
+
+class TopResultsCache:
+    """
+    TOP-N результатов в памяти процесса (общий для всех Storage одной БД).
+    Загружается одним запросом, дальше поддерживается инкрементально:
+    новая запись вставляется, только если она лучше N-й.
+    """
+
+    def __init__(self, size: int = TOP_CACHE_SIZE):
+        self.size = size
+        self.lock = threading.Lock()
+        self._rows: list[tuple[int, ResultRow]] | None = None  # (results.id, строка)
+
+    @property
+    def loaded(self) -> bool:
+        return self._rows is not None
+
+    def get(self, limit: int) -> list[tuple[int, ResultRow]] | None:
+        with self.lock:
+            if self._rows is None or limit > self.size:
+                return None
+            return self._rows[:limit]
+
+    def load(self, rows: list[tuple[int, ResultRow]]) -> None:
+        self._rows = rows[: self.size]
+
+    def offer(self, result_id: int, row: ResultRow) -> None:
+        with self.lock:
+            rows = self._rows
+            if rows is None or any(rid == result_id for rid, _ in rows):
+                return
+            key = (row.score, row.created_at, result_id)
+            last_id, last = rows[-1] if rows else (0, None)
+            if len(rows) >= self.size and key <= (last.score, last.created_at, last_id):
+                return
+
+            pos = len(rows)
+            for i, (other_id, other) in enumerate(rows):
+                if key > (other.score, other.created_at, other_id):
+                    pos = i
+                    break
+            rows.insert(pos, (result_id, row))
+            del rows[self.size :]
+
+    def clear(self) -> None:
+        with self.lock:
+            self._rows = None
+
+
+_top_caches: dict[str, TopResultsCache] = {}
+_top_caches_lock = threading.Lock()
+
+
+def top_cache_for(db_path: Path) -> TopResultsCache:
+    key = str(db_path.resolve())
+    with _top_caches_lock:
+        cache = _top_caches.get(key)
+        if cache is None:
+            cache = _top_caches[key] = TopResultsCache()
+        return cache
 
 
 class Storage:
+    """
+    SQLite-хранилище результатов.
+    Одно долгоживущее соединение на объект (WAL, настроенные pragma),
+    схема мигрируется один раз при первом подключении.
+    """
+
     def __init__(self, db_path: str = "typing_fall.db"):
         self.db_path = Path(db_path)
+        self._conn: sqlite3.Connection | None = None
+        self.top_cache = top_cache_for(self.db_path)
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON;")
-        return conn
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode = WAL;")
+            conn.execute("PRAGMA synchronous = NORMAL;")
+            conn.execute("PRAGMA cache_size = -8000;")  # ~8 МБ
+            conn.execute("PRAGMA temp_store = MEMORY;")
+            conn.execute("PRAGMA foreign_keys = ON;")
+            self._conn = conn
+            self.init_schema()
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> Storage:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     def init_schema(self) -> None:
-        with self._connect() as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS players(
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    nickname TEXT NOT NULL UNIQUE
-                );
-                """
-            )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS results(
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    player_id INTEGER NOT NULL,
-                    score INTEGER NOT NULL,
-                    wpm REAL NOT NULL,
-                    accuracy REAL NOT NULL,
-                    created_at TEXT NOT NULL DEFAULT (datetime('now')),
-                    FOREIGN KEY(player_id) REFERENCES players(id)
-                );
-                """
-            )
+        conn = self._connect()
+        version = int(conn.execute("PRAGMA user_version;").fetchone()[0])
+        if version >= SCHEMA_VERSION:
+            return
+
+        # sqlite3 сам не открывает транзакцию перед DDL — открываем явно.
+        # IMMEDIATE сразу берёт блокировку записи: второй процесс/поток ждёт,
+        # а затем видит уже обновлённую версию и ничего не применяет.
+        conn.execute("BEGIN IMMEDIATE;")
+        try:
+            version = int(conn.execute("PRAGMA user_version;").fetchone()[0])
+            for target, statements in MIGRATIONS:
+                if target <= version:
+                    continue
+                for sql in statements:
+                    conn.execute(sql)
+                # PRAGMA не принимает параметры, версия — наш же int
+                conn.execute(f"PRAGMA user_version = {int(target)};")
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+
+    def _upsert_player(self, conn: sqlite3.Connection, nickname: str) -> int:
+        cur = conn.execute(
+            """
+            INSERT INTO players(nickname) VALUES (?)
+            ON CONFLICT(nickname) DO UPDATE SET nickname = excluded.nickname
+            RETURNING id;
+            """,
+            (nickname.strip(),),
+        )
+        return int(cur.fetchone()[0])
 
     def get_or_create_player_id(self, nickname: str) -> int:
-        nickname = nickname.strip()
-        with self._connect() as conn:
-            cur = conn.execute("SELECT id FROM players WHERE nickname = ?;", (nickname,))
-            row = cur.fetchone()
-            if row:
-                return int(row[0])
-
-            conn.execute("INSERT INTO players(nickname) VALUES (?);", (nickname,))
-            cur2 = conn.execute("SELECT id FROM players WHERE nickname = ?;", (nickname,))
-            return int(cur2.fetchone()[0])
-
-    def save_result(self, nickname: str, score: int, wpm: float, accuracy: float) -> None:
-        self.init_schema()
-        player_id = self.get_or_create_player_id(nickname)
-
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO results(player_id, score, wpm, accuracy)
-                VALUES (?, ?, ?, ?);
-                """,
-                (player_id, int(score), float(wpm), float(accuracy)),
-            )
+        conn = self._connect()
+        with conn:
+            return self._upsert_player(conn, nickname)
+
+    def save_result(
+        self,
+        nickname: str,
+        score: int,
+        wpm: float,
+        accuracy: float,
+        settings: Settings | None = None,
+    ) -> None:
+        if settings is None:
+            pending = PendingResult(nickname, int(score), float(wpm), float(accuracy))
+        else:
+            pending = PendingResult.from_settings(nickname, score, wpm, accuracy, settings)
+        self.save_results([pending])
+
+    def save_results(self, results: Iterable[PendingResult]) -> list[ResultRow]:
+        """Пачка результатов одной транзакцией. Возвращает записанные строки."""
+        conn = self._connect()
+        inserted: list[tuple[int, ResultRow]] = []
+        with conn:
+            for r in results:
+                nickname = r.nickname.strip()
+                player_id = self._upsert_player(conn, nickname)
+                result_id, created_at = conn.execute(
+                    """
+                    INSERT INTO results(
+                        player_id, score, wpm, accuracy, language, difficulty, mode, duration_sec
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    RETURNING id, created_at;
+                    """,
+                    (
+                        player_id,
+                        int(r.score),
+                        float(r.wpm),
+                        float(r.accuracy),
+                        r.language,
+                        int(r.difficulty),
+                        r.mode,
+                        int(r.duration_sec),
+                    ),
+                ).fetchone()
+                row = ResultRow(
+                    nickname,
+                    int(r.score),
+                    float(r.wpm),
+                    float(r.accuracy),
+                    str(created_at),
+                    r.language,
+                    int(r.difficulty),
+                    r.mode,
+                    int(r.duration_sec),
+                    int(result_id),
+                )
+                if r.replay is not None:
+                    conn.execute(
+                        "INSERT INTO replays(result_id, data) VALUES (?, ?);",
+                        (int(result_id), sqlite3.Binary(r.replay)),
+                    )
+                inserted.append((int(result_id), row))
+
+        # после коммита — обновляем TOP в памяти
+        for result_id, row in inserted:
+            self.top_cache.offer(result_id, row)
+        return [row for _, row in inserted]
+
+    def rank_of(self, score: int, created_at: str, result_id: int) -> tuple[int, int]:
+        """
+        Место результата в общем рейтинге и число результатов: (N, M).
+        Очки выше считаются по score_histogram (по числу различных очков,
+        а не строк), равные очки — поиском по idx_results_order в порядке
+        рейтинга (created_at, id), так что место совпадает с leaderboard_page.
+        """
+        conn = self._connect()
+        better = conn.execute(
+            "SELECT COALESCE(SUM(n), 0) FROM score_histogram WHERE score > ?;",
+            (int(score),),
+        ).fetchone()[0]
+        total = conn.execute("SELECT COALESCE(SUM(n), 0) FROM score_histogram;").fetchone()[0]
+        newer_ties = conn.execute(
+            "SELECT COUNT(*) FROM results WHERE score = ? AND (created_at, id) > (?, ?);",
+            (int(score), str(created_at), int(result_id)),
+        ).fetchone()[0]
+        return int(better) + int(newer_ties) + 1, int(total)
+
+    def result(self, result_id: int) -> ResultRow | None:
+        conn = self._connect()
+        row = conn.execute(
+            f"""
+            SELECT {_RESULT_COLUMNS}
+            FROM results r
+            JOIN players p ON p.id = r.player_id
+            WHERE r.id = ?;
+            """,
+            (int(result_id),),
+        ).fetchone()
+        return _row_from_db(row)[1] if row is not None else None
+
+    def replay_of(self, result_id: int) -> bytes | None:
+        """Сырой реплей результата (Replay.decode) или None, если не записан."""
+        conn = self._connect()
+        row = conn.execute("SELECT data FROM replays WHERE result_id = ?;", (int(result_id),)).fetchone()
+        return bytes(row[0]) if row is not None else None
 
     def top_results(self, limit: int = 10) -> list[ResultRow]:
-        self.init_schema()
-
-        with self._connect() as conn:
-            cur = conn.execute(
-                """
-                SELECT p.nickname, r.score, r.wpm, r.accuracy, r.created_at
-                FROM results r
-                JOIN players p ON p.id = r.player_id
-                ORDER BY r.score DESC, r.created_at DESC
+        return [row for _, row in self._top(int(limit))]
+
+    def _top(self, limit: int) -> list[tuple[int, ResultRow]]:
+        cached = self.top_cache.get(limit)
+        if cached is not None:
+            return cached
+
+        with self.top_cache.lock:
+            rows = self._query_page(None, None, max(limit, self.top_cache.size))
+            if limit <= self.top_cache.size:
+                self.top_cache.load(rows)
+        return rows[:limit]
+
+    def leaderboard_page(
+        self,
+        flt: LeaderboardFilter | None = None,
+        after: PageCursor | None = None,
+        limit: int = 10,
+    ) -> tuple[list[ResultRow], PageCursor | None]:
+        """
+        Страница рейтинга после строки after (keyset/seek, без OFFSET):
+        без фильтра или с полным фильтром (см. LeaderboardFilter) страница
+        читается обратным обходом индекса от курсора, и её стоимость не
+        зависит от номера страницы.
+        Возвращает строки и курсор для следующей страницы (None — дальше пусто).
+        """
+        unfiltered = flt is None or flt == LeaderboardFilter()
+        if unfiltered and after is None:
+            rows = self._top(int(limit))  # первая страница — из кэша TOP
+        else:
+            rows = self._query_page(flt, after, int(limit))
+
+        if len(rows) < int(limit):
+            next_cursor = None
+        else:
+            last_id, last = rows[-1]
+            next_cursor = PageCursor(last.score, last.created_at, last_id)
+        return [row for _, row in rows], next_cursor
+
+    def _query_page(
+        self,
+        flt: LeaderboardFilter | None,
+        after: PageCursor | None,
+        limit: int,
+    ) -> list[tuple[int, ResultRow]]:
+        where: list[str] = []
+        params: list = []
+        if flt is not None:
+            for column, value in (
+                ("language", flt.language),
+                ("difficulty", flt.difficulty),
+                ("mode", flt.mode),
+            ):
+                if value is not None:
+                    where.append(f"r.{column} = ?")
+                    params.append(value)
+        if after is not None:
+            where.append("(r.score, r.created_at, r.id) < (?, ?, ?)")
+            params.extend((after.score, after.created_at, after.id))
+
+        sql = f"""
+            SELECT {_RESULT_COLUMNS}
+            FROM results r
+            JOIN players p ON p.id = r.player_id
+            {"WHERE " + " AND ".join(where) if where else ""}
+            ORDER BY r.score DESC, r.created_at DESC, r.id DESC
+            LIMIT ?;
+        """
+        params.append(int(limit))
+
+        conn = self._connect()
+        return [_row_from_db(row) for row in conn.execute(sql, params).fetchall()]
+
+    def best_per_player_page(
+        self,
+        after: PageCursor | None = None,
+        limit: int = 10,
+    ) -> tuple[list[PlayerStats], PageCursor | None]:
+        """
+        Рейтинг по лучшему результату каждого игрока (из player_stats,
+        без агрегации по results). Курсор: (best_score, last_played, player_id).
+        """
+        where = ""
+        params: list = []
+        if after is not None:
+            where = "WHERE (s.best_score, s.last_played, s.player_id) < (?, ?, ?)"
+            params.extend((after.score, after.created_at, after.id))
+        params.append(int(limit))
+
+        conn = self._connect()
+        rows = [
+            _stats_from_db(row)
+            for row in conn.execute(
+                f"""
+                SELECT {_STATS_COLUMNS}
+                FROM player_stats s
+                JOIN players p ON p.id = s.player_id
+                {where}
+                ORDER BY s.best_score DESC, s.last_played DESC, s.player_id DESC
                 LIMIT ?;
                 """,
-                (int(limit),),
-            )
+                params,
+            ).fetchall()
+        ]
 
-            out: list[ResultRow] = []
-            for nickname, score, wpm, accuracy, created_at in cur.fetchall():
-                out.append(
-                    ResultRow(
-                        nickname=str(nickname),
-                        score=int(score),
-                        wpm=float(wpm),
-                        accuracy=float(accuracy),
-                        created_at=str(created_at),
-                    )
-                )
-            return out
\ No newline at end of file
+        if len(rows) < int(limit):
+            next_cursor = None
+        else:
+            player_id, last = rows[-1]
+            next_cursor = PageCursor(last.best_score, last.last_played, player_id)
+        return [stats for _, stats in rows], next_cursor
+
+    def player_profile(self, nickname: str) -> PlayerStats | None:
+        """Сводка игрока: два поиска по ключу (players.nickname, player_stats PK)."""
+        conn = self._connect()
+        row = conn.execute(
+            f"""
+            SELECT {_STATS_COLUMNS}
+            FROM players p
+            JOIN player_stats s ON s.player_id = p.id
+            WHERE p.nickname = ?;
+            """,
+            (nickname.strip(),),
+        ).fetchone()
+        if row is None:
+            return None
+        return _stats_from_db(row)[1]
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-import arcade
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # симуляция должна импортироваться без arcade
+    import arcade
 
 
 MODE_ENDLESS = "endless"
 MODE_TIMED = "timed"
+MODE_PRACTICE = "practice"  # как endless, но слова под слабые буквы игрока
+MODES = (MODE_ENDLESS, MODE_TIMED, MODE_PRACTICE)
 
 
 @dataclass
 class Settings:
     language: str = "ru"       # "ru" | "en"
     difficulty: int = 1        # 1..3
-    mode: str = MODE_ENDLESS   # endless | timed
+    mode: str = MODE_ENDLESS   # endless | timed | practice
     duration_sec: int = 60     # 60..600
 
 
@@ -20,6 +25,8 @@ class Settings:
 class Session:
     nickname: str = ""
     settings: Settings = field(default_factory=Settings)
+    # буква/биграмма -> сколько раз на ней ошибались (за сессию)
+    weakness: dict[str, int] = field(default_factory=dict)
 
 
 class Router:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from concurrent.futures import Future
+
 import arcade
 
 from src.typing_fall.constants import (
@@ -16,12 +18,33 @@ from src.typing_fall.ui_models import Router
 class ResultsView(arcade.View):
     """Финальное окно: результаты игры."""
 
-    def __init__(self, router: Router, score: int, wpm: float, accuracy: float):
+    def __init__(
+        self,
+        router: Router,
+        score: int,
+        wpm: float,
+        accuracy: float,
+        saved: Future | None = None,
+    ):
         super().__init__()
         self.router = router
         self.score = score
         self.wpm = wpm
         self.accuracy = accuracy
+        # запись в БД идёт в фоне, тут только показываем её статус
+        self.saved = saved
+
+    def _save_status(self) -> str:
+        if self.saved is None:
+            return ""
+        if not self.saved.done():
+            return "Сохраняем результат..."
+        if self.saved.exception() is not None:
+            return "Не удалось сохранить результат"
+        saved = self.saved.result()
+        if saved.rank is None:
+            return "Результат сохранён"
+        return f"Результат сохранён: место #{saved.rank} из {saved.total}"
 
     def on_show_view(self):
         arcade.set_background_color(BG_COLOR)
@@ -61,6 +84,15 @@ class ResultsView(arcade.View):
             align="center",
         )
 
+        arcade.draw_text(
+            self._save_status(),
+            SCREEN_WIDTH / 2,
+            SCREEN_HEIGHT * 0.12,
+            SUBTEXT_COLOR,
+            font_size=14,
+            anchor_x="center",
+        )
+
         arcade.draw_text(
             "ENTER — в меню\n3 — рейтинг",
             SCREEN_WIDTH / 2,
@@ -81,35 +113,78 @@ class ResultsView(arcade.View):
             self.router.go(MenuView(self.router))
 
 
+PAGE_SIZE = 10
+
+
 class LeaderboardView(arcade.View):
-    """Экран рейтинга (TOP из SQLite)."""
+    """
+    Экран рейтинга (SQLite): постраничный (keyset) и с фильтром
+    по текущим настройкам (язык + сложность + режим).
+    B — лучший результат каждого игрока (из сводки player_stats).
+    """
 
     def __init__(self, router: Router):
         super().__init__()
         self.router = router
         self.rows: list[str] = []
 
+        self.only_current = False
+        self.best_per_player = False
+        self._cursors: list = [None]  # курсоры начала открытых страниц
+        self._next_cursor = None
+        self._storage = None
+
     def on_show_view(self):
         arcade.set_background_color(BG_COLOR)
 
         from src.typing_fall.storage import Storage
 
-        storage = Storage()
-        top = storage.top_results(10)
+        self._storage = Storage()
+        self._load_page()
+
+    def on_hide_view(self):
+        if self._storage is not None:
+            self._storage.close()
+            self._storage = None
 
-        if not top:
-            self.rows = ["Пока нет результатов. Сыграй первую игру :)"]
+    def _filter(self):
+        from src.typing_fall.storage import LeaderboardFilter
+
+        if not self.only_current:
+            return None
+        return LeaderboardFilter.for_settings(self.router.session.settings)
+
+    def _load_page(self):
+        if self.best_per_player:
+            page, self._next_cursor = self._storage.best_per_player_page(self._cursors[-1], PAGE_SIZE)
+        else:
+            page, self._next_cursor = self._storage.leaderboard_page(
+                self._filter(), self._cursors[-1], PAGE_SIZE
+            )
+
+        if not page:
+            if len(self._cursors) == 1:
+                self.rows = ["Пока нет результатов. Сыграй первую игру :)"]
+            else:
+                self.rows = ["Дальше пусто"]
             return
 
+        first = (len(self._cursors) - 1) * PAGE_SIZE + 1
         self.rows = []
-        for i, r in enumerate(top, start=1):
-            self.rows.append(f"{i}) {r.nickname} — {r.score} (WPM {r.wpm:.1f}, {r.accuracy*100:.0f}%)")
+        for i, r in enumerate(page, start=first):
+            if self.best_per_player:
+                self.rows.append(
+                    f"{i}) {r.nickname} — {r.best_score} (WPM {r.best_wpm:.1f}, "
+                    f"ср. {r.avg_accuracy*100:.0f}%, игр {r.games})"
+                )
+            else:
+                self.rows.append(f"{i}) {r.nickname} — {r.score} (WPM {r.wpm:.1f}, {r.accuracy*100:.0f}%)")
 
     def on_draw(self):
         self.clear()
 
         arcade.draw_text(
-            "Рейтинг (TOP 10)",
+            "Рейтинг",
             SCREEN_WIDTH / 2,
             SCREEN_HEIGHT * 0.72,
             TEXT_COLOR,
@@ -117,8 +192,24 @@ class LeaderboardView(arcade.View):
             anchor_x="center",
         )
 
+        s = self.router.session.settings
+        if self.best_per_player:
+            scope = "лучшие по игрокам"
+        elif self.only_current:
+            scope = f"{s.language.upper()}, сложность {s.difficulty}, {s.mode}"
+        else:
+            scope = "все игры"
+        arcade.draw_text(
+            f"Страница {len(self._cursors)} | {scope}",
+            SCREEN_WIDTH / 2,
+            SCREEN_HEIGHT * 0.655,
+            ACCENT_COLOR,
+            font_size=14,
+            anchor_x="center",
+        )
+
         y = SCREEN_HEIGHT * 0.60
-        for line in self.rows[:10]:
+        for line in self.rows[:PAGE_SIZE]:
             arcade.draw_text(
                 line,
                 SCREEN_WIDTH / 2,
@@ -130,15 +221,36 @@ class LeaderboardView(arcade.View):
             y -= 30
 
         arcade.draw_text(
-            "ENTER / ESC — в меню",
+            "← / → — страницы | F — фильтр | B — по игрокам | ENTER / ESC — в меню",
             SCREEN_WIDTH / 2,
             SCREEN_HEIGHT * 0.18,
             SUBTEXT_COLOR,
-            font_size=18,
+            font_size=16,
             anchor_x="center",
         )
 
     def on_key_press(self, symbol: int, modifiers: int):
-        if symbol in (arcade.key.ENTER, arcade.key.ESCAPE):
+        if symbol == arcade.key.RIGHT:
+            if self._next_cursor is not None:
+                self._cursors.append(self._next_cursor)
+                self._load_page()
+
+        elif symbol == arcade.key.LEFT:
+            if len(self._cursors) > 1:
+                self._cursors.pop()
+                self._load_page()
+
+        elif symbol == arcade.key.F:
+            self.only_current = not self.only_current
+            self.best_per_player = False
+            self._cursors = [None]
+            self._load_page()
+
+        elif symbol == arcade.key.B:
+            self.best_per_player = not self.best_per_player
+            self._cursors = [None]
+            self._load_page()
+
+        elif symbol in (arcade.key.ENTER, arcade.key.ESCAPE):
             from src.typing_fall.views_start_menu import MenuView
-            self.router.go(MenuView(self.router))
\ No newline at end of file
+            self.router.go(MenuView(self.router))
@@ -10,7 +10,8 @@ from src.typing_fall.constants import (
     SUBTEXT_COLOR,
     ACCENT_COLOR,
 )
-from src.typing_fall.ui_models import Router, MODE_ENDLESS, MODE_TIMED
+from src.typing_fall.ui_models import Router, MODE_ENDLESS, MODE_TIMED, MODE_PRACTICE, MODES
+from src.typing_fall.words import shared_provider
 
 
 class SettingsView(arcade.View):
@@ -37,7 +38,12 @@ class SettingsView(arcade.View):
         self.title_text.draw()
 
         s = self.router.session.settings
-        mode_name = "Бесконечная" if s.mode == MODE_ENDLESS else "По времени"
+        if s.mode == MODE_ENDLESS:
+            mode_name = "Бесконечная"
+        elif s.mode == MODE_TIMED:
+            mode_name = "По времени"
+        else:
+            mode_name = "Практика (слабые буквы)"
 
         arcade.draw_text(
             f"Игрок: {self.router.session.nickname}",
@@ -51,7 +57,7 @@ class SettingsView(arcade.View):
         arcade.draw_text(
             "L — язык (RU/EN)\n"
             "1/2/3 — сложность\n"
-            "M — режим (endless/timed)\n"
+            "M — режим (endless/timed/practice)\n"
             "+ / - — время (если timed)\n"
             "ENTER / ESC — назад в меню",
             SCREEN_WIDTH / 2,
@@ -93,7 +99,7 @@ class SettingsView(arcade.View):
             s.difficulty = 3
 
         elif symbol == arcade.key.M:
-            s.mode = MODE_TIMED if s.mode == MODE_ENDLESS else MODE_ENDLESS
+            s.mode = MODES[(MODES.index(s.mode) + 1) % len(MODES)]
 
         elif symbol in (arcade.key.PLUS, arcade.key.EQUAL):
             s.duration_sec = min(600, s.duration_sec + 30)
@@ -102,4 +108,8 @@ class SettingsView(arcade.View):
 
         elif symbol in (arcade.key.ENTER, arcade.key.ESCAPE):
             from src.typing_fall.views_start_menu import MenuView
-            self.router.go(MenuView(self.router))
\ No newline at end of file
+            self.router.go(MenuView(self.router))
+
+        # индекс букв для практики строится в фоне, пока игрок в настройках
+        if s.mode == MODE_PRACTICE:
+            shared_provider().prefetch_letter_index(s.language, int(s.difficulty))
\ No newline at end of file
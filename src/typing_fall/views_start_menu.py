@@ -13,6 +13,8 @@ from src.typing_fall.constants import (
     NICKNAME_MAX_LEN,
 )
 from src.typing_fall.ui_models import Router
+from src.typing_fall.words import shared_provider
+from src.typing_fall.assets import assets
 
 
 class StartView(arcade.View):
@@ -51,6 +53,9 @@ class StartView(arcade.View):
 
     def on_show_view(self):
         arcade.set_background_color(BG_COLOR)
+        # словари и звуки грузятся в фоне, пока игрок в меню
+        shared_provider().prefetch()
+        assets().preload()
 
     def on_draw(self):
         self.clear()
@@ -130,6 +135,9 @@ class MenuView(arcade.View):
 
     def on_show_view(self):
         arcade.set_background_color(BG_COLOR)
+        # словари и звуки грузятся в фоне, пока игрок в меню
+        shared_provider().prefetch()
+        assets().preload()
 
     def on_draw(self):
         self.clear()
@@ -153,8 +161,8 @@ class MenuView(arcade.View):
 
         elif symbol == arcade.key.KEY_2:
             from src.typing_fall.game_core import GameView
-            from src.typing_fall.effects import Effects
-            self.router.go(GameView(self.router, Effects()))
+            from src.typing_fall.effects import shared_effects
+            self.router.go(GameView(self.router, shared_effects()))
 
         elif symbol == arcade.key.KEY_3:
             from src.typing_fall.views_results_leaderboard import LeaderboardView
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Iterable
+
+import arcade
+from arcade.texture_atlas import AllocatorException
+
+from src.typing_fall.simulation import WORD_HALF_HEIGHT
+
+
+CARD_HEIGHT = int(WORD_HALF_HEIGHT * 2)
+CARD_MIN_WIDTH = CARD_HEIGHT
+CARD_PADDING = 12
+CARD_COLOR = (255, 255, 255, 235)
+LABEL_FONT_SIZE = 18
+
+# Карточки живут в своём атласе, а не в ctx.default_atlas: у атласа всего
+# 8192 uv-слота (TEXCOORD_BUFFER_SIZE), а место под удалённые текстуры
+# не освобождается до полной очистки. Поэтому атлас ограничен MAX_CARDS
+# карточками и при переполнении очищается целиком (generation += 1).
+MAX_CARDS = 1024
+ATLAS_SIZE = (2048, 2048)
+
+
+class WordAtlas:
+    """
+    Готовые текстуры слов: карточка + надпись рендерятся один раз
+    прямо в texture atlas, дальше слово — обычный спрайт,
+    и всё поле рисуется одним SpriteList.draw() (SpriteList(atlas=atlas.atlas)).
+
+    Атлас ограничен max_cards: при переполнении он очищается и
+    generation растёт — текстуры прошлых поколений больше не валидны,
+    спрайты на экране нужно перевыставить (см. GameView._sync_atlas).
+    """
+
+    def __init__(self, max_cards: int = MAX_CARDS):
+        self.max_cards = max_cards
+        self.generation = 0
+        self._atlas: arcade.TextureAtlas | None = None
+        # порядок — от давно не использованных к свежим
+        self._textures: OrderedDict[str, arcade.Texture] = OrderedDict()
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._textures
+
+    def __len__(self) -> int:
+        return len(self._textures)
+
+    @property
+    def atlas(self) -> arcade.TextureAtlas:
+        if self._atlas is None:
+            self._atlas = arcade.TextureAtlas(ATLAS_SIZE, ctx=arcade.get_window().ctx)
+        return self._atlas
+
+    def clear(self) -> None:
+        self.atlas.clear()
+        self._textures.clear()
+        self.generation += 1
+
+    def build(self, words: Iterable[str]) -> None:
+        words = list(words)
+        missing = sum(1 for w in words if w not in self._textures)
+        if len(self._textures) + missing > self.max_cards:
+            self.clear()  # новый словарь не влезает рядом со старым
+        for word in words[: self.max_cards]:
+            self.texture(word)
+
+    def texture(self, word: str) -> arcade.Texture:
+        tex = self._textures.get(word)
+        if tex is not None:
+            self._textures.move_to_end(word)
+            return tex
+
+        if len(self._textures) >= self.max_cards:
+            self.clear()
+        try:
+            tex = self._render(word)
+        except AllocatorException:
+            # атлас упёрся в максимальный размер раньше лимита карточек
+            self.clear()
+            tex = self._render(word)
+        self._textures[word] = tex
+        return tex
+
+    def _render(self, word: str) -> arcade.Texture:
+        label = arcade.Text(
+            word,
+            0,
+            0,
+            arcade.color.BLACK,
+            font_size=LABEL_FONT_SIZE,
+            anchor_x="center",
+            anchor_y="center",
+        )
+        width = max(CARD_MIN_WIDTH, int(label.content_width) + CARD_PADDING * 2)
+        height = CARD_HEIGHT
+
+        # поколение в имени: Texture сравниваются по имени, а старая карточка
+        # того же слова после clear() указывает на чужое место в атласе
+        tex = arcade.Texture.create_empty(f"word-card:{self.generation}:{word}", (width, height))
+        atlas = self.atlas
+        atlas.add(tex)
+
+        label.x = width / 2
+        label.y = height / 2
+        with atlas.render_into(tex) as fbo:
+            fbo.clear()
+            arcade.draw_rectangle_filled(width / 2, height / 2, width, height, CARD_COLOR)
+            label.draw()
+        return tex
+
+
+_shared: WordAtlas | None = None
+
+
+def shared_atlas() -> WordAtlas:
+    """Один атлас на процесс: слова, уже отрендеренные в прошлых играх, переиспользуются."""
+    global _shared
+    if _shared is None:
+        _shared = WordAtlas()
+    return _shared
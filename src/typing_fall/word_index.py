@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+
+_NO_IDS: frozenset[int] = frozenset()
+
+
+class WordIndex:
+    """
+    Индекс активных слов:
+    - точный текст -> id слов (в порядке спавна)
+    - каждый префикс -> множество id
+
+    Обновляется инкрементально (add/remove за O(len(word))),
+    поиск совпадения и префикса — один lookup в dict.
+    """
+
+    def __init__(self):
+        self._exact: dict[str, list[int]] = {}
+        self._prefix: dict[str, set[int]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(ids) for ids in self._exact.values())
+
+    def __contains__(self, text: object) -> bool:
+        return text in self._exact
+
+    def add(self, word_id: int, text: str) -> None:
+        self._exact.setdefault(text, []).append(word_id)
+        for k in range(1, len(text) + 1):
+            self._prefix.setdefault(text[:k], set()).add(word_id)
+
+    def remove(self, word_id: int, text: str) -> None:
+        ids = self._exact.get(text)
+        if not ids or word_id not in ids:
+            return
+        ids.remove(word_id)
+        if not ids:
+            del self._exact[text]
+
+        for k in range(1, len(text) + 1):
+            p = text[:k]
+            bucket = self._prefix.get(p)
+            if bucket is None:
+                continue
+            bucket.discard(word_id)
+            if not bucket:
+                del self._prefix[p]
+
+    def find(self, text: str) -> int:
+        """id самого старого слова с таким текстом или -1."""
+        ids = self._exact.get(text)
+        return ids[0] if ids else -1
+
+    def matching(self, prefix: str) -> frozenset[int] | set[int]:
+        """id слов, которые начинаются с prefix (пустой prefix — ничего)."""
+        if not prefix:
+            return _NO_IDS
+        return self._prefix.get(prefix, _NO_IDS)
+
+    def clear(self) -> None:
+        self._exact.clear()
+        self._prefix.clear()
@@ -1,39 +1,137 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Iterable, Sequence
 import random
+import threading
+import time
+
+from src.typing_fall.corpus import open_corpus
+from src.typing_fall.sampling import WordSampler
+from src.typing_fall.letter_index import LetterIndex
 
 
 class WordProvider:
     """
     Загружает слова из assets/words/{lang}_{difficulty}.txt
     Пример: ru_1.txt, en_3.txt
+
+    .txt один раз компилируется в бинарный словарь (assets/words/.cache),
+    дальше он открывается через mmap: выбор слова — O(1) без чтения файла целиком.
+
+    prefetch() прогревает все наборы в фоновом потоке, load_times — сколько
+    секунд занял каждый набор.
     """
 
+    LANGUAGES = ("ru", "en")
+    DIFFICULTIES = (1, 2, 3)
+
     def __init__(self, words_dir: str = "assets/words"):
         self.words_dir = Path(words_dir)
-        self._cache: dict[tuple[str, int], list[str]] = {}
+        self._cache: dict[tuple[str, int], Sequence[str]] = {}
+        self.load_times: dict[tuple[str, int], float] = {}
+        self._lock = threading.Lock()
+        self._prefetch_thread: threading.Thread | None = None
+        self._samplers: dict[tuple[str, int], WordSampler] = {}
+        self._letter_indexes: dict[tuple[str, int], LetterIndex] = {}
+        self._index_threads: dict[tuple[str, int], threading.Thread] = {}
 
-    def _read_file(self, path: Path) -> list[str]:
+    def _read_file(self, path: Path) -> Sequence[str]:
         if not path.exists():
             return []
-        words: list[str] = []
-        for line in path.read_text(encoding="utf-8").splitlines():
-            w = line.strip()
-            if w:
-                words.append(w)
-        return words
+        try:
+            return open_corpus(path)
+        except OSError:
+            # кэш некуда записать — читаем .txt как раньше
+            return [w for w in (line.strip() for line in path.read_text(encoding="utf-8").splitlines()) if w]
+
+    def words(self, language: str, difficulty: int) -> Sequence[str]:
+        key = (language, int(difficulty))
+        words = self._cache.get(key)
+        if words is not None:
+            return words
+
+        # если набор сейчас грузит prefetch — ждём его, а не читаем второй раз
+        with self._lock:
+            if key not in self._cache:
+                started = time.perf_counter()
+                filename = f"{language}_{difficulty}.txt"
+                words = self._read_file(self.words_dir / filename)
+
+                # чтобы игра никогда не падала
+                if not len(words):
+                    words = ["test", "word", "typing"] if language == "en" else ["тест", "слово", "печать"]
+
+                self._cache[key] = words
+                self.load_times[key] = time.perf_counter() - started
+
+        return self._cache[key]
+
+    def letter_index(self, language: str, difficulty: int) -> LetterIndex:
+        """Индекс буква/биграмма -> слова, строится один раз на словарь (блокирующе)."""
+        key = (language, int(difficulty))
+        index = self._letter_indexes.get(key)
+        if index is None:
+            index = self._letter_indexes[key] = LetterIndex(self.words(language, difficulty))
+        return index
+
+    def prefetch_letter_index(self, language: str, difficulty: int) -> threading.Thread:
+        """Строит индекс в фоне (для практики). Повторный вызов ничего не делает."""
+        key = (language, int(difficulty))
+        thread = self._index_threads.get(key)
+        if thread is None:
+            thread = threading.Thread(
+                target=self.letter_index,
+                args=key,
+                name=f"letter-index-{language}-{difficulty}",
+                daemon=True,
+            )
+            self._index_threads[key] = thread
+            thread.start()
+        return thread
+
+    def letter_index_nowait(self, language: str, difficulty: int) -> LetterIndex | None:
+        """Готовый индекс или None (тогда запускает фоновую сборку, кадр не ждёт)."""
+        index = self._letter_indexes.get((language, int(difficulty)))
+        if index is None:
+            self.prefetch_letter_index(language, difficulty)
+        return index
+
+    def prefetch(self, keys: Iterable[tuple[str, int]] | None = None) -> threading.Thread:
+        """Фоновая загрузка наборов (по умолчанию — всех). Повторный вызов ничего не делает."""
+        if self._prefetch_thread is not None:
+            return self._prefetch_thread
+
+        if keys is None:
+            keys = [(lang, d) for lang in self.LANGUAGES for d in self.DIFFICULTIES]
+        keys = list(keys)
+
+        def run():
+            for language, difficulty in keys:
+                self.words(language, difficulty)
+
+        self._prefetch_thread = threading.Thread(target=run, name="words-prefetch", daemon=True)
+        self._prefetch_thread.start()
+        return self._prefetch_thread
+
+    def sampler(self, language: str, difficulty: int, rng: random.Random | None = None) -> WordSampler:
+        """Новый сэмплер по набору (свой rng — для детерминированных прогонов)."""
+        return WordSampler(self.words(language, difficulty), rng)
 
     def get_word(self, language: str, difficulty: int) -> str:
         key = (language, int(difficulty))
-        if key not in self._cache:
-            filename = f"{language}_{difficulty}.txt"
-            words = self._read_file(self.words_dir / filename)
+        sampler = self._samplers.get(key)
+        if sampler is None:
+            sampler = self._samplers[key] = self.sampler(language, difficulty)
+        return sampler.draw()
+
 
-            # чтобы игра никогда не падала
-            if not words:
-                words = ["test", "word", "typing"] if language == "en" else ["тест", "слово", "печать"]
+_shared: WordProvider | None = None
 
-            self._cache[key] = words
 
-        return random.choice(self._cache[key])
\ No newline at end of file
+def shared_provider() -> WordProvider:
+    """Один WordProvider на процесс: кэш словарей переживает отдельные игры."""
+    global _shared
+    if _shared is None:
+        _shared = WordProvider()
+    return _shared